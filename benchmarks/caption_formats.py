@@ -0,0 +1,102 @@
+"""Compare payload size and parse time of the srv1, srv3 and json3 caption formats.
+
+Usage:
+    python benchmarks/caption_formats.py                      # synthetic 2 hour track
+    python benchmarks/caption_formats.py --video-id dQw4w9WgXcQ --language en
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import timeit
+from collections.abc import Callable
+from typing import get_args
+
+import httpx
+
+from aioytt import CompactSnippet
+from aioytt.transcript import CaptionFormat
+from aioytt.transcript import TranscriptClient
+from aioytt.transcript import get_caption_track
+from aioytt.transcript import parse_transcript
+from aioytt.transcript import parse_transcript_json3
+from aioytt.transcript import parse_transcript_srv3
+
+PARSERS: dict[CaptionFormat, Callable[[str], list[CompactSnippet]]] = {
+    "srv1": lambda body: parse_transcript(body, output="compact"),
+    "srv3": lambda body: parse_transcript_srv3(body, output="compact"),
+    "json3": lambda body: parse_transcript_json3(body, output="compact"),
+}
+
+
+def synthetic_payloads(lines: int) -> dict[CaptionFormat, str]:
+    """Build equivalent srv1, srv3 and json3 documents with the given number of lines."""
+    words = ["so", "today", "we", "are", "going", "to", "talk", "about", "caption", "formats"]
+    srv1 = ['<?xml version="1.0" encoding="utf-8" ?><transcript>']
+    srv3 = ['<?xml version="1.0" encoding="utf-8" ?><timedtext format="3"><body>']
+    events = []
+    for i in range(lines):
+        start = i * 2500
+        line = words[i % len(words) :] + words[: i % len(words)]
+        srv1.append(f'<text start="{start / 1000}" dur="2.5">{" ".join(line)}</text>')
+        segments = f'<s ac="0">{line[0]}</s>' + "".join(
+            f'<s t="{j * 250}" ac="0"> {word}</s>' for j, word in enumerate(line[1:], 1)
+        )
+        srv3.append(f'<p t="{start}" d="2500" w="1">{segments}</p>')
+        events.append(
+            {
+                "tStartMs": start,
+                "dDurationMs": 2500,
+                "wWinId": 1,
+                "segs": [{"utf8": line[0]}]
+                + [{"utf8": f" {word}", "tOffsetMs": j * 250} for j, word in enumerate(line[1:], 1)],
+            }
+        )
+    srv1.append("</transcript>")
+    srv3.append("</body></timedtext>")
+    return {
+        "srv1": "".join(srv1),
+        "srv3": "".join(srv3),
+        "json3": json.dumps({"wireMagic": "pb3", "events": events}),
+    }
+
+
+async def fetch_payloads(video_id: str, language: str) -> dict[CaptionFormat, str]:
+    """Download the same caption track in every format."""
+    async with TranscriptClient() as client:
+        captions = await client.get_captions(video_id)
+        base_url = get_caption_track(captions.caption_tracks, [language]).base_url
+        if base_url is None:
+            raise SystemExit(f"No caption URL for {video_id}")
+        return {
+            caption_format: await client.fetch_html(str(httpx.URL(base_url).copy_merge_params({"fmt": caption_format})))
+            for caption_format in get_args(CaptionFormat)
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--video-id", help="benchmark a real caption track instead of a synthetic one")
+    parser.add_argument("--language", default="en")
+    parser.add_argument("--lines", type=int, default=2880, help="lines in the synthetic track")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.video_id:
+        payloads = asyncio.run(fetch_payloads(args.video_id, args.language))
+    else:
+        payloads = synthetic_payloads(args.lines)
+
+    print(f"{'format':<8}{'bytes':>12}{'snippets':>10}{'parse ms':>12}")
+    for caption_format, body in payloads.items():
+        parse = PARSERS[caption_format]
+        snippets = parse(body)
+        timer = timeit.Timer(lambda body=body, parse=parse: parse(body))
+        seconds = min(timer.repeat(repeat=args.repeat, number=1))
+        print(f"{caption_format:<8}{len(body.encode()):>12}{len(snippets):>10}{seconds * 1000:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,16 +6,36 @@ from typing import Final
 
 from loguru import logger
 
-from .transcript import TranscriptSnippet
+from .snippet import CompactSnippet
+from .snippet import TranscriptSnippet
+from .table import TranscriptTable
+from .transcript import TranscriptClient
+from .transcript import aclose_default_client
 from .transcript import get_transcript_from_url
 from .transcript import get_transcript_from_video_id
+from .transcript import get_transcripts
+from .transcript import get_transcripts_by_language
+from .transcript import iter_caption_tracks
+from .transcript import iter_transcripts
+from .transcript import list_caption_tracks
+from .transcript import stream_transcript
 from .video_id import parse_video_id
 
 __all__ = [
+    "aclose_default_client",
     "get_transcript_from_url",
     "get_transcript_from_video_id",
+    "get_transcripts",
+    "get_transcripts_by_language",
+    "iter_caption_tracks",
+    "iter_transcripts",
+    "list_caption_tracks",
     "parse_video_id",
+    "stream_transcript",
+    "CompactSnippet",
+    "TranscriptClient",
     "TranscriptSnippet",
+    "TranscriptTable",
 ]
 
 LOGURU_LEVEL: Final[str] = os.getenv("LOGURU_LEVEL", "INFO")
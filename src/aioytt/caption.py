@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+
 from pydantic import BaseModel
 from pydantic import Field
 
@@ -8,6 +12,9 @@ class Captions(BaseModel):
     caption_tracks: list[CaptionTrack] = Field(default_factory=list, validation_alias="captionTracks")
     audio_tracks: list[AudioTrack] = Field(default_factory=list, validation_alias="audioTracks")
     default_audio_track_index: int | None = Field(default=None, validation_alias="defaultAudioTrackIndex")
+    translation_languages: list[TranslationLanguage] = Field(
+        default_factory=list, validation_alias="translationLanguages"
+    )
 
 
 class Name(BaseModel):
@@ -32,3 +39,68 @@ class AudioTrack(BaseModel):
 class TranslationLanguage(BaseModel):
     language_code: str | None = Field(default=None, validation_alias="languageCode")
     language_name: Name | None = Field(default=None, validation_alias="languageName")
+
+
+@dataclass(slots=True, frozen=True)
+class CaptionTrackData:
+    """Lightweight, unvalidated mirror of CaptionTrack.
+
+    Built straight from player response JSON produced by our own parser, so
+    hot paths can read caption tracks without running pydantic validation.
+    Use to_model() to get the validated CaptionTrack.
+    """
+
+    base_url: str | None
+    name: str | None
+    vss_id: str | None
+    language_code: str | None
+    kind: str | None
+    is_translatable: bool | None
+    track_name: str | None
+    data: dict[str, Any] = field(repr=False, compare=False)
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> CaptionTrackData:
+        name = data.get("name")
+        return cls(
+            base_url=data.get("baseUrl"),
+            name=name.get("simpleText") if isinstance(name, dict) else None,
+            vss_id=data.get("vssId"),
+            language_code=data.get("languageCode"),
+            kind=data.get("kind"),
+            is_translatable=data.get("isTranslatable"),
+            track_name=data.get("trackName"),
+            data=data,
+        )
+
+    def to_model(self) -> CaptionTrack:
+        return CaptionTrack.model_validate(self.data)
+
+
+@dataclass(slots=True, frozen=True)
+class CaptionsData:
+    """Lightweight, unvalidated mirror of Captions.
+
+    Only the caption tracks and the codes of the translation languages are
+    unpacked; to_model() validates the original JSON into the public Captions
+    model on demand.
+    """
+
+    caption_tracks: list[CaptionTrackData]
+    translation_language_codes: list[str]
+    data: dict[str, Any] = field(repr=False, compare=False)
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> CaptionsData:
+        return cls(
+            caption_tracks=[CaptionTrackData.from_json(track) for track in data.get("captionTracks", [])],
+            translation_language_codes=[
+                language["languageCode"]
+                for language in data.get("translationLanguages", [])
+                if isinstance(language, dict) and "languageCode" in language
+            ],
+            data=data,
+        )
+
+    def to_model(self) -> Captions:
+        return Captions.model_validate(self.data)
@@ -30,3 +30,18 @@ class InitialPlayerResponseNotFoundError(AioyttError):
 class CaptionsNotFoundError(AioyttError):
     def __init__(self) -> None:
         super().__init__("No captions found in the video")
+
+
+class TranslationNotAvailableError(AioyttError):
+    def __init__(self, language_code: str) -> None:
+        super().__init__(f"captions cannot be translated to: {language_code}")
+
+
+class VideoUnplayableError(AioyttError):
+    def __init__(self, status: str | None, reason: str | None = None) -> None:
+        self.status = status
+        self.reason = reason
+        message = f"video is not playable: {status}"
+        if reason:
+            message += f" ({reason})"
+        super().__init__(message)
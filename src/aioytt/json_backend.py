@@ -0,0 +1,77 @@
+"""JSON decoding backend used for player responses and caption payloads.
+
+The fastest installed backend is picked automatically, in the order orjson,
+msgspec, then the standard library json module. Set the AIOYTT_JSON_BACKEND
+environment variable or call set_json_backend() to choose one explicitly.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import os
+from collections.abc import Callable
+from typing import Any
+from typing import Final
+
+JSON_BACKENDS: Final[tuple[str, ...]] = ("orjson", "msgspec", "json")
+
+_backend: str = "json"
+_loads: Callable[[str | bytes], Any] = json.loads
+
+
+def _load_backend(name: str) -> Callable[[str | bytes], Any]:
+    if name == "orjson":
+        return importlib.import_module("orjson").loads
+    if name == "msgspec":
+        return importlib.import_module("msgspec.json").decode
+    if name == "json":
+        return json.loads
+    raise ValueError(f"unknown JSON backend: {name}, expected one of {', '.join(JSON_BACKENDS)}")
+
+
+def set_json_backend(name: str | None = None) -> str:
+    """Select the JSON backend.
+
+    Args:
+        name: One of "orjson", "msgspec" or "json". None picks the fastest installed backend.
+
+    Returns:
+        The name of the selected backend.
+
+    Raises:
+        ValueError: If name is not a known backend.
+        ImportError: If the requested backend is not installed.
+    """
+    global _backend, _loads
+
+    if name is None:
+        for candidate in JSON_BACKENDS:
+            try:
+                _loads = _load_backend(candidate)
+            except ImportError:
+                continue
+            _backend = candidate
+            break
+        return _backend
+
+    _loads = _load_backend(name)
+    _backend = name
+    return _backend
+
+
+def get_json_backend() -> str:
+    """Return the name of the JSON backend in use."""
+    return _backend
+
+
+def loads(data: str | bytes) -> Any:
+    """Decode a JSON document with the selected backend.
+
+    Raises:
+        ValueError: If data is not valid JSON. All backends raise a subclass of ValueError.
+    """
+    return _loads(data)
+
+
+set_json_backend(os.getenv("AIOYTT_JSON_BACKEND") or None)
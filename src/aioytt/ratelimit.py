@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from abc import ABC
+from abc import abstractmethod
+from email.utils import parsedate_to_datetime
+from typing import Final
+
+from loguru import logger
+
+THROTTLE_STATUS_CODES: Final[frozenset[int]] = frozenset({429, 503})
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header into a number of seconds.
+
+    Args:
+        value: Header value, either delay seconds or an HTTP date.
+
+    Returns:
+        Seconds to wait (never negative), or None if the value is missing or invalid.
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class RateLimiter(ABC):
+    """Base class for rate limiters applied by TranscriptClient before each request.
+
+    Subclasses implement acquire(), which waits until a request to the given
+    host may be sent. The client reports each response back through
+    on_success() and on_throttle(), which adaptive limiters use to tune
+    their rate; both are no-ops by default.
+    """
+
+    @abstractmethod
+    async def acquire(self, host: str) -> None:
+        """Wait until a request to host may be sent."""
+
+    def on_success(self, host: str) -> None:  # noqa: B027
+        """Called after a successful response from host."""
+
+    def on_throttle(self, host: str, retry_after: float | None, *, sent_at: float | None = None) -> None:  # noqa: B027
+        """Called after host answered with 429 or 503.
+
+        Args:
+            host: Host that throttled the request.
+            retry_after: Retry-After delay in seconds, if the response had one.
+            sent_at: time.monotonic() when the throttled request was sent, if known.
+        """
+
+
+class TokenBucket:
+    """Async token bucket that refills at a constant rate up to a burst size.
+
+    Waiters are served in arrival order, so concurrent callers share the
+    budget fairly instead of racing for freshly refilled tokens.
+
+    Args:
+        rate: Tokens added per second.
+        burst: Maximum number of tokens the bucket can hold.
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        if burst < 1:
+            raise ValueError(f"burst must be at least 1, got {burst}")
+
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = max(0.0, now - self._updated_at)
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._updated_at = max(now, self._updated_at)
+
+    def set_rate(self, rate: float) -> None:
+        """Change the refill rate, keeping the tokens accumulated so far."""
+        self._refill()
+        self.rate = rate
+
+    def block(self, seconds: float) -> None:
+        """Hand out no tokens for the given number of seconds, then refill from empty."""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+        self._tokens = 0.0
+        self._updated_at = self._blocked_until
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and consume it."""
+        async with self._lock:
+            while True:
+                delay = self._blocked_until - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                    continue
+
+                self._refill()
+                if self._tokens >= 1:
+                    break
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+            self._tokens -= 1
+
+
+class TokenBucketRateLimiter(RateLimiter):
+    """Rate limiter that keeps one token bucket per host.
+
+    Args:
+        rate: Requests per second allowed for each host.
+        burst: Number of requests each host may receive back to back.
+
+    Example:
+        >>> limiter = TokenBucketRateLimiter(rate=5, burst=10)
+        >>> client = TranscriptClient(rate_limiter=limiter)
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def _bucket(self, host: str) -> TokenBucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = TokenBucket(self.rate, self.burst)
+            self._buckets[host] = bucket
+        return bucket
+
+    async def acquire(self, host: str) -> None:
+        await self._bucket(host).acquire()
+
+
+class AdaptiveRateLimiter(TokenBucketRateLimiter):
+    """Per-host token bucket whose rate adapts to throttling (AIMD).
+
+    Each successful response raises the host's rate by a fixed step, up to
+    max_rate. A 429/503 response multiplies it by decrease, down to min_rate,
+    and a Retry-After delay pauses the host for that long. Throttled
+    requests that were sent before the last decrease only apply their
+    Retry-After delay, however late their response arrives, so a burst of
+    concurrent 429s lowers the rate once rather than collapsing it to
+    min_rate. A throttle reported without sent_at always lowers the rate.
+
+    Without max_rate the limiter only recovers to its initial rate and never
+    probes above it. Pass a higher max_rate to let it search for the fastest
+    rate the host tolerates.
+
+    Args:
+        rate: Initial requests per second for each host.
+        burst: Number of requests each host may receive back to back.
+        min_rate: Lowest rate the limiter backs off to.
+        max_rate: Highest rate the limiter recovers to. Defaults to rate.
+        increase: Requests per second added after each success.
+        decrease: Factor applied to the rate after a throttled response.
+
+    Example:
+        >>> limiter = AdaptiveRateLimiter(rate=5, burst=10, max_rate=20)
+        >>> client = TranscriptClient(rate_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        *,
+        min_rate: float = 0.1,
+        max_rate: float | None = None,
+        increase: float = 0.05,
+        decrease: float = 0.5,
+    ) -> None:
+        super().__init__(rate, burst)
+        if not 0 < decrease < 1:
+            raise ValueError(f"decrease must be between 0 and 1, got {decrease}")
+
+        self.min_rate = min_rate
+        self.max_rate = rate if max_rate is None else max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self._decreased_at: dict[str, float] = {}
+
+    def on_success(self, host: str) -> None:
+        bucket = self._bucket(host)
+        if bucket.rate < self.max_rate:
+            bucket.set_rate(min(self.max_rate, bucket.rate + self.increase))
+
+    def on_throttle(self, host: str, retry_after: float | None, *, sent_at: float | None = None) -> None:
+        bucket = self._bucket(host)
+        now = time.monotonic()
+        decreased_at = self._decreased_at.get(host)
+        # Requests sent before the last decrease were paced by the old rate and say nothing about the new one.
+        if decreased_at is None or sent_at is None or sent_at >= decreased_at:
+            bucket.set_rate(max(self.min_rate, bucket.rate * self.decrease))
+            self._decreased_at[host] = now
+            logger.debug(f"Throttled by {host}, lowering rate to {bucket.rate:.2f} req/s")
+
+        if retry_after is not None:
+            bucket.block(retry_after)
@@ -0,0 +1,151 @@
+"""Caption track selection by language, base language and track kind.
+
+get_caption_track() picks the first track whose language code matches, in
+priority order, and falls back to the first track. CaptionTrackIndex instead
+indexes the tracks once and applies a policy such as "prefer manual captions,
+then automatic ones, then a machine translation", so the best available track
+is chosen before anything is downloaded.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Final
+from typing import Literal
+from typing import cast
+from typing import get_args
+
+from .caption import CaptionTrack
+from .caption import CaptionTrackData
+
+# "manual" tracks are uploaded by the creator, "asr" tracks are generated by speech
+# recognition, and "translated" tracks are another track machine-translated via tlang.
+TrackSource = Literal["manual", "asr", "translated"]
+
+DEFAULT_SELECTION_POLICY: Final[tuple[TrackSource, ...]] = ("manual", "asr", "translated")
+
+_ASR_KIND: Final[str] = "asr"
+
+
+@dataclass(slots=True, frozen=True)
+class TrackSelection[T: (CaptionTrack, CaptionTrackData)]:
+    """A caption track chosen by CaptionTrackIndex.select().
+
+    Attributes:
+        caption_track: The track to download.
+        source: How the track satisfies the requested language.
+        language_code: The requested language code that was matched.
+        translate_to: Language to pass as tlang when source is "translated", otherwise None.
+    """
+
+    caption_track: T
+    source: TrackSource
+    language_code: str
+    translate_to: str | None = None
+
+
+def base_language(language_code: str) -> str:
+    """Return the primary subtag of a language code, e.g. "en" for "en-US"."""
+    return language_code.split("-", 1)[0].lower()
+
+
+def validate_selection_policy(policy: Iterable[str]) -> tuple[TrackSource, ...]:
+    """Return policy as a tuple, checking that every entry is a known track source.
+
+    Raises:
+        ValueError: If policy is empty or contains an unknown source.
+    """
+    policy = tuple(policy)
+    if not policy:
+        raise ValueError("selection policy must not be empty")
+    for source in policy:
+        if source not in get_args(TrackSource):
+            raise ValueError(f"unknown track source: {source}, expected one of {', '.join(get_args(TrackSource))}")
+    return cast("tuple[TrackSource, ...]", policy)
+
+
+class CaptionTrackIndex[T: (CaptionTrack, CaptionTrackData)]:
+    """Index of a video's caption tracks by language, base language and kind.
+
+    The index is built once from the tracks of one player response; each
+    select() call is then a handful of dictionary lookups instead of a scan
+    over every track per requested language.
+
+    Args:
+        caption_tracks: Caption tracks of the video, in player response order.
+        translation_language_codes: Languages YouTube offers to translate tracks into.
+            An empty list allows any language, as older player responses omit it.
+
+    Example:
+        >>> index = CaptionTrackIndex(captions.caption_tracks, captions.translation_language_codes)
+        >>> selection = index.select(["en-US", "ja"], policy=("manual", "asr"))
+    """
+
+    def __init__(self, caption_tracks: Iterable[T], translation_language_codes: Iterable[str] = ()) -> None:
+        self._exact: dict[tuple[str, bool], T] = {}
+        self._base: dict[tuple[str, bool], T] = {}
+        self._translatable: list[T] = []
+        self._translation_language_codes = frozenset(translation_language_codes)
+
+        for caption_track in caption_tracks:
+            is_asr = caption_track.kind == _ASR_KIND
+            if caption_track.language_code is not None:
+                self._exact.setdefault((caption_track.language_code, is_asr), caption_track)
+                self._base.setdefault((base_language(caption_track.language_code), is_asr), caption_track)
+            if caption_track.is_translatable and caption_track.base_url is not None:
+                self._translatable.append(caption_track)
+
+        # Translate from a manual track when there is one; they are more accurate than ASR.
+        self._translatable.sort(key=lambda caption_track: caption_track.kind == _ASR_KIND)
+
+    def select(
+        self,
+        language_codes: str | Iterable[str],
+        policy: Iterable[TrackSource] = DEFAULT_SELECTION_POLICY,
+    ) -> TrackSelection[T] | None:
+        """Choose the best track for the requested languages.
+
+        Languages are tried in priority order, and for each language the
+        sources are tried in policy order. A "manual" or "asr" source matches
+        the exact language code first, then any track with the same base
+        language ("en" matches "en-US" and the other way round). A
+        "translated" source picks a translatable track, preferring manual
+        ones, to be translated into the requested language.
+
+        Args:
+            language_codes: Language code(s) in priority order.
+            policy: Track sources to accept, in order of preference.
+
+        Returns:
+            The selected track, or None if no track satisfies the policy.
+        """
+        if isinstance(language_codes, str):
+            language_codes = [language_codes]
+
+        policy = validate_selection_policy(policy)
+        for language_code in language_codes:
+            for source in policy:
+                selection = self._select_source(language_code, source)
+                if selection is not None:
+                    return selection
+        return None
+
+    def _select_source(self, language_code: str, source: TrackSource) -> TrackSelection[T] | None:
+        if source == "translated":
+            if self._translation_language_codes and language_code not in self._translation_language_codes:
+                return None
+            for caption_track in self._translatable:
+                if caption_track.language_code == language_code:
+                    # Already in the requested language; the manual or asr sources cover it.
+                    continue
+                return TrackSelection(caption_track, source, language_code, translate_to=language_code)
+            return None
+
+        is_asr = source == "asr"
+        caption_track = self._exact.get((language_code, is_asr))
+        if caption_track is None:
+            caption_track = self._base.get((base_language(language_code), is_asr))
+        if caption_track is None:
+            return None
+        return TrackSelection(caption_track, source, language_code)
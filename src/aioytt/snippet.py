@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from typing import NamedTuple
+
+from pydantic import BaseModel
+
+
+class TranscriptSnippet(BaseModel):
+    """A single snippet of transcript with timing information.
+
+    Attributes:
+        text: The transcript text (HTML entities decoded).
+        start: Start time in seconds.
+        duration: Duration in seconds.
+    """
+
+    text: str
+    start: float
+    duration: float
+
+
+class CompactSnippet(NamedTuple):
+    """Lightweight transcript snippet stored as a tuple.
+
+    Returned instead of TranscriptSnippet when output="compact" is requested;
+    it skips model validation and uses far less memory per snippet.
+
+    Attributes:
+        text: The transcript text (HTML entities decoded).
+        start: Start time in seconds.
+        duration: Duration in seconds.
+    """
+
+    text: str
+    start: float
+    duration: float
+
+    def to_model(self) -> TranscriptSnippet:
+        """Convert to a TranscriptSnippet."""
+        return TranscriptSnippet(text=self.text, start=self.start, duration=self.duration)
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+from collections.abc import Iterable
+from collections.abc import Iterator
+from contextlib import closing
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Final
+
+from .snippet import CompactSnippet
+
+# Bump whenever the table layout changes; files stamped with another version are rebuilt.
+_SCHEMA_VERSION: Final[int] = 1
+
+_SCHEMA: Final[tuple[str, ...]] = (
+    """
+CREATE TABLE IF NOT EXISTS transcripts (
+    video_id TEXT NOT NULL,
+    languages TEXT NOT NULL,
+    caption_format TEXT NOT NULL,
+    words INTEGER NOT NULL,
+    translate_to TEXT NOT NULL,
+    selection_policy TEXT NOT NULL,
+    vss_id TEXT,
+    language_code TEXT,
+    snippets TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (video_id, languages, caption_format, words, translate_to, selection_policy)
+)
+""",
+    "CREATE INDEX IF NOT EXISTS transcripts_accessed_at ON transcripts (accessed_at)",
+)
+
+_KEY_COLUMNS = (
+    "video_id = ? AND languages = ? AND caption_format = ? AND words = ? AND translate_to = ? AND selection_policy = ?"
+)
+
+
+class SQLiteTranscriptCache:
+    """Persistent transcript cache stored in a local SQLite file.
+
+    Transcripts are keyed by video ID, the requested language preference, the
+    caption format they were downloaded in, whether they were split into
+    words, their translation target and the track selection policy that chose
+    the track. Each entry also records the vss_id and language code of the
+    track it came from.
+    Entries expire ttl seconds after they are written; once more than
+    max_entries are stored, the least recently read entries are evicted.
+
+    The database runs in WAL mode with a busy timeout, so several processes on
+    one host can share the same file. The file records its schema version;
+    a file written with another layout is emptied and rebuilt when opened. Methods are blocking; TranscriptClient
+    calls them from a worker thread.
+
+    Args:
+        path: Path of the SQLite database file.
+        ttl: Seconds a transcript stays valid.
+        max_entries: Maximum number of transcripts kept.
+        timeout: Seconds to wait for a lock held by another connection.
+
+    Example:
+        >>> cache = SQLiteTranscriptCache("transcripts.db", ttl=7 * 86400)
+        >>> client = TranscriptClient(transcript_cache=cache)
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        ttl: float = 7 * 24 * 3600,
+        max_entries: int = 100_000,
+        timeout: float = 30.0,
+    ) -> None:
+        if ttl <= 0:
+            raise ValueError(f"ttl must be positive, got {ttl}")
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.timeout = timeout
+
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            # Hold the write lock so concurrent processes do not rebuild the table under each other.
+            conn.execute("BEGIN IMMEDIATE")
+            if conn.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+                # Entries are only a cache, so a file with another layout is emptied rather than migrated.
+                conn.execute("DROP TABLE IF EXISTS transcripts")
+                for statement in _SCHEMA:
+                    conn.execute(statement)
+                conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        with closing(sqlite3.connect(self.path, timeout=self.timeout)) as conn, conn:
+            yield conn
+
+    def get(
+        self,
+        video_id: str,
+        language_codes: Iterable[str],
+        caption_format: str = "srv1",
+        translate_to: str | None = None,
+        selection_policy: Iterable[str] | None = None,
+        words: bool = False,
+    ) -> list[CompactSnippet] | None:
+        """Return the cached transcript, or None if it is missing or expired."""
+        key = (
+            video_id,
+            _languages_key(language_codes),
+            caption_format,
+            int(words),
+            translate_to or "",
+            _selection_policy_key(selection_policy),
+        )
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute(
+                f"SELECT snippets FROM transcripts WHERE {_KEY_COLUMNS} AND created_at > ?",
+                (*key, now - self.ttl),
+            ).fetchone()
+            if row is None:
+                return None
+
+            conn.execute(
+                f"UPDATE transcripts SET accessed_at = ? WHERE {_KEY_COLUMNS}",
+                (now, *key),
+            )
+
+        return [CompactSnippet(text, start, duration) for text, start, duration in json.loads(row[0])]
+
+    def set(
+        self,
+        video_id: str,
+        language_codes: Iterable[str],
+        transcript: Iterable[CompactSnippet],
+        *,
+        caption_format: str = "srv1",
+        translate_to: str | None = None,
+        selection_policy: Iterable[str] | None = None,
+        words: bool = False,
+        vss_id: str | None = None,
+        language_code: str | None = None,
+    ) -> None:
+        """Store a transcript and evict expired and least recently read entries."""
+        snippets = json.dumps(list(transcript))
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO transcripts VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    video_id,
+                    _languages_key(language_codes),
+                    caption_format,
+                    int(words),
+                    translate_to or "",
+                    _selection_policy_key(selection_policy),
+                    vss_id,
+                    language_code,
+                    snippets,
+                    now,
+                    now,
+                ),
+            )
+            conn.execute("DELETE FROM transcripts WHERE created_at <= ?", (now - self.ttl,))
+            conn.execute(
+                "DELETE FROM transcripts WHERE rowid IN "
+                "(SELECT rowid FROM transcripts ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM transcripts")
+
+    def __len__(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM transcripts").fetchone()[0]
+
+
+def _languages_key(language_codes: Iterable[str]) -> str:
+    return ",".join(language_codes)
+
+
+def _selection_policy_key(selection_policy: Iterable[str] | None) -> str:
+    # "default" stands for get_caption_track(), which falls back to the first track.
+    if selection_policy is None:
+        return "default"
+    return ",".join(selection_policy)
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import importlib
+from array import array
+from collections.abc import Iterable
+from collections.abc import Iterator
+from typing import Any
+from typing import overload
+
+from .snippet import CompactSnippet
+from .snippet import TranscriptSnippet
+
+
+class TranscriptTable:
+    """Columnar transcript with array-backed timing columns.
+
+    Start times and durations are stored in array("d") buffers and texts in a
+    single list, instead of one object per snippet. The timing columns support
+    the buffer protocol, so memoryview() or to_numpy() exports them without
+    copying.
+
+    Indexing returns a CompactSnippet, slicing returns a new TranscriptTable
+    and iteration yields CompactSnippet tuples.
+
+    Args:
+        texts: Snippet texts.
+        starts: Start times in seconds.
+        durations: Durations in seconds.
+
+    Example:
+        >>> table = await get_transcript_from_video_id("dQw4w9WgXcQ", output="table")
+        >>> starts, durations = table.to_numpy()
+    """
+
+    __slots__ = ("texts", "starts", "durations")
+
+    def __init__(
+        self, texts: Iterable[str] = (), starts: Iterable[float] = (), durations: Iterable[float] = ()
+    ) -> None:
+        self.texts = list(texts)
+        self.starts = starts if isinstance(starts, array) and starts.typecode == "d" else array("d", starts)
+        self.durations = (
+            durations if isinstance(durations, array) and durations.typecode == "d" else array("d", durations)
+        )
+        if not len(self.texts) == len(self.starts) == len(self.durations):
+            raise ValueError("texts, starts and durations must have the same length")
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[tuple[str, float, float]]) -> TranscriptTable:
+        """Build a table from (text, start, duration) rows such as CompactSnippet tuples."""
+        table = cls()
+        for text, start, duration in rows:
+            table.append(text, start, duration)
+        return table
+
+    def append(self, text: str, start: float, duration: float) -> None:
+        """Append one snippet to the table."""
+        self.texts.append(text)
+        self.starts.append(start)
+        self.durations.append(duration)
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def __iter__(self) -> Iterator[CompactSnippet]:
+        return map(CompactSnippet, self.texts, self.starts, self.durations)
+
+    @overload
+    def __getitem__(self, index: int) -> CompactSnippet: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> TranscriptTable: ...
+
+    def __getitem__(self, index: int | slice) -> CompactSnippet | TranscriptTable:
+        if isinstance(index, slice):
+            return TranscriptTable(self.texts[index], self.starts[index], self.durations[index])
+        return CompactSnippet(self.texts[index], self.starts[index], self.durations[index])
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TranscriptTable):
+            return NotImplemented
+        return self.texts == other.texts and self.starts == other.starts and self.durations == other.durations
+
+    def __repr__(self) -> str:
+        return f"TranscriptTable(<{len(self)} snippets>)"
+
+    def to_snippets(self) -> list[TranscriptSnippet]:
+        """Convert to a list of TranscriptSnippet models."""
+        return [snippet.to_model() for snippet in self]
+
+    def to_numpy(self) -> tuple[Any, Any]:
+        """Return (starts, durations) as NumPy float64 arrays sharing memory with the table.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        numpy = importlib.import_module("numpy")
+        return numpy.frombuffer(self.starts, dtype=numpy.float64), numpy.frombuffer(self.durations, dtype=numpy.float64)
@@ -1,26 +1,89 @@
 from __future__ import annotations
 
+import asyncio
+import functools
 import json
+import re
+import time
+from collections.abc import AsyncIterable
+from collections.abc import AsyncIterator
+from collections.abc import Awaitable
+from collections.abc import Callable
 from collections.abc import Iterable
+from collections.abc import Iterator
+from concurrent.futures import Executor
+from contextlib import aclosing
 from html import unescape
+from typing import TYPE_CHECKING
+from typing import Any
 from typing import Final
+from typing import Literal
+from typing import NoReturn
+from typing import overload
+from urllib.parse import parse_qs
+from urllib.parse import urlsplit
+from weakref import WeakKeyDictionary
 from xml.etree import ElementTree
 
 import httpx
 from loguru import logger
-from pydantic import BaseModel
+from tenacity import RetryCallState
 from tenacity import retry
+from tenacity import retry_if_exception
 from tenacity import retry_if_exception_type
 from tenacity import stop_after_attempt
 from tenacity import wait_exponential
 
+from .cache import TTLCache
 from .caption import Captions
+from .caption import CaptionsData
 from .caption import CaptionTrack
+from .caption import CaptionTrackData
+from .errors import AioyttError
 from .errors import CaptionsNotFoundError
 from .errors import InitialPlayerResponseNotFoundError
+from .errors import TranslationNotAvailableError
+from .errors import VideoUnplayableError
+from .json_backend import get_json_backend
+from .json_backend import loads as json_loads
+from .ratelimit import THROTTLE_STATUS_CODES
+from .ratelimit import RateLimiter
+from .ratelimit import parse_retry_after
+from .selection import CaptionTrackIndex
+from .selection import TrackSource
+from .selection import validate_selection_policy
+from .singleflight import SingleFlight
+from .snippet import CompactSnippet
+from .snippet import TranscriptSnippet
+from .table import TranscriptTable
 from .video_id import parse_video_id
+from .xml_backend import fromstring as xml_fromstring
+
+if TYPE_CHECKING:
+    from .sqlite_cache import SQLiteTranscriptCache
 
 WATCH_URL: Final[str] = "https://www.youtube.com/watch?"
+INNERTUBE_PLAYER_URL: Final[str] = "https://www.youtube.com/youtubei/v1/player"
+# Client identity sent with InnerTube player requests; the Android client returns
+# caption URLs that can be fetched without additional tokens.
+DEFAULT_INNERTUBE_CONTEXT: Final[dict[str, Any]] = {"client": {"clientName": "ANDROID", "clientVersion": "20.10.38"}}
+PLAYER_RESPONSE_MARKER: Final[str] = "var ytInitialPlayerResponse ="
+DEFAULT_MAX_CONCURRENCY: Final[int] = 10
+MAX_RETRY_AFTER: Final[float] = 60.0
+CAPTION_URL_EXPIRY_MARGIN: Final[float] = 60.0
+DEFAULT_PARSE_OFFLOAD_THRESHOLD: Final[int] = 64 * 1024
+
+# Errors that depend only on the video, so repeating the request gives the same answer. A page
+# without a player response is left out: consent and captcha interstitials look the same.
+NEGATIVE_CACHEABLE_ERRORS: Final = (CaptionsNotFoundError,)
+
+_SCRIPT_END: Final[str] = "</script>"
+_PLAYER_RESPONSE_START: Final[re.Pattern[str]] = re.compile(re.escape(PLAYER_RESPONSE_MARKER) + r"\s*")
+_CAPTIONS_START: Final[re.Pattern[str]] = re.compile(r'"captions"\s*:\s*(?=\{\s*"playerCaptionsTracklistRenderer")')
+_JSON_DECODER: Final[json.JSONDecoder] = json.JSONDecoder()
+# The player response object is usually followed by more statements in the same script,
+# e.g. ";var head = ..." or ";var meta = ...".
+_PLAYER_RESPONSE_TRAILER: Final[re.Pattern[str]] = re.compile(r"\}\s*;\s*var\s")
 
 _FORMATTING_TAGS = [
     "strong",  # important
@@ -36,25 +99,97 @@ _FORMATTING_TAGS = [
 ]
 
 
-class TranscriptSnippet(BaseModel):
-    """A single snippet of transcript with timing information.
+# "model" returns TranscriptSnippet models, "compact" returns CompactSnippet tuples
+# and "table" returns a columnar TranscriptTable.
+TranscriptOutput = Literal["model", "compact", "table"]
+Transcript = list[TranscriptSnippet] | list[CompactSnippet] | TranscriptTable
+
+# Timedtext formats requested with the fmt query parameter: "srv1" is the default XML
+# returned by base_url, "srv3" is XML with word-level timing and "json3" is JSON.
+CaptionFormat = Literal["srv1", "srv3", "json3"]
+
+# Where caption tracks are discovered: "watch_page" scrapes ytInitialPlayerResponse
+# from the watch page HTML, "innertube" asks the youtubei player endpoint for JSON.
+CaptionSource = Literal["watch_page", "innertube"]
+
 
-    Attributes:
-        text: The transcript text (HTML entities decoded).
-        start: Start time in seconds.
-        duration: Duration in seconds.
+def _decode_captions_renderer(html: str, start: int) -> dict | None:
+    """Decode only playerCaptionsTracklistRenderer from the player response starting at start.
+
+    Returns None when the captions object cannot be found within the player
+    response script, so the caller can fall back to a full decode.
     """
+    end = html.find(_SCRIPT_END, start)
+    match = _CAPTIONS_START.search(html, start, len(html) if end < 0 else end)
+    if match is None:
+        return None
+
+    try:
+        captions_json, _ = _JSON_DECODER.raw_decode(html, match.end())
+    except json.JSONDecodeError:
+        return None
+
+    if not isinstance(captions_json, dict):
+        return None
+    return captions_json.get("playerCaptionsTracklistRenderer")
+
+
+def _decode_player_response(html: str, start: int) -> dict:
+    """Decode the whole player response object starting at start."""
+    if get_json_backend() != "json":
+        # Fast backends cannot decode from an offset, so cut the object out of its script first.
+        end = html.find(_SCRIPT_END, start)
+        data = html[start : len(html) if end < 0 else end]
+        trailer = _PLAYER_RESPONSE_TRAILER.search(data)
+        if trailer is not None:
+            data = data[: trailer.start() + 1]
+        data = data.rstrip().rstrip(";")
+        try:
+            return json_loads(data)
+        except ValueError:
+            logger.debug("Fast JSON backend failed on the player response, falling back to json")
+
+    # Decode the object in place; the decoder stops at its closing brace, so the
+    # page is never split or copied.
+    response_json, _ = _JSON_DECODER.raw_decode(html, start)
+    return response_json
+
+
+def _raise_missing_captions(response_json: dict) -> NoReturn:
+    """Raise the error for a player response that has no caption tracks."""
+    # Only a playable video without tracks says anything lasting about its captions; other
+    # statuses such as LOGIN_REQUIRED depend on the client and must not be negative-cached.
+    playability = response_json.get("playabilityStatus") or {}
+    status = playability.get("status")
+    if status != "OK":
+        raise VideoUnplayableError(status, playability.get("reason"))
+    raise CaptionsNotFoundError()
+
+
+def _extract_captions_json(html: str) -> dict:
+    match = _PLAYER_RESPONSE_START.search(html)
+    if match is None:
+        raise InitialPlayerResponseNotFoundError()
 
-    text: str
-    start: float
-    duration: float
+    captions_json = _decode_captions_renderer(html, match.end())
+    if captions_json is None:
+        response_json = _decode_player_response(html, match.end())
+        captions_json = (response_json.get("captions") or {}).get("playerCaptionsTracklistRenderer")
+        if not captions_json or "captionTracks" not in captions_json:
+            _raise_missing_captions(response_json)
+
+    if not captions_json or "captionTracks" not in captions_json:
+        raise CaptionsNotFoundError()
+
+    return captions_json
 
 
 def parse_captions(html: str) -> Captions:
     """Parse caption data from YouTube video page HTML.
 
     Extracts the ytInitialPlayerResponse JSON from the HTML and parses
-    the caption tracks information.
+    the caption tracks information. Only the captions object is decoded when
+    it can be located directly; otherwise the whole player response is.
 
     Args:
         html: YouTube video page HTML content.
@@ -64,30 +199,69 @@ def parse_captions(html: str) -> Captions:
 
     Raises:
         InitialPlayerResponseNotFoundError: If ytInitialPlayerResponse variable not found.
-        CaptionsNotFoundError: If no caption tracks found in the response.
+        CaptionsNotFoundError: If the video is playable but has no caption tracks.
+        VideoUnplayableError: If the player response has no caption tracks because the video is
+            not playable for this client, e.g. it requires login.
     """
-    splitted_html = html.split("var ytInitialPlayerResponse =")
+    return Captions.model_validate(_extract_captions_json(html))
+
+
+def parse_captions_data(html: str) -> CaptionsData:
+    """Parse caption data from YouTube video page HTML without validation.
+
+    Same extraction as parse_captions(), but builds lightweight CaptionsData
+    instead of validating pydantic models, for hot loops that only need the
+    caption tracks. Call to_model() on the result to get Captions.
+
+    Args:
+        html: YouTube video page HTML content.
+
+    Returns:
+        CaptionsData object containing the caption tracks.
+
+    Raises:
+        InitialPlayerResponseNotFoundError: If ytInitialPlayerResponse variable not found.
+        CaptionsNotFoundError: If the video is playable but has no caption tracks.
+        VideoUnplayableError: If the player response has no caption tracks because the video is
+            not playable for this client, e.g. it requires login.
+    """
+    return CaptionsData.from_json(_extract_captions_json(html))
 
-    if len(splitted_html) < 2:
-        raise InitialPlayerResponseNotFoundError()
 
-    data = splitted_html[1]
-    data = data.split("</script>")[0]
-    data = data.split(";var head =")[0]
-    data = data.strip(";")
+def parse_player_response_captions(data: str | bytes) -> CaptionsData:
+    """Parse caption data from an InnerTube player response without validation.
 
-    response_json = json.loads(data)
+    Args:
+        data: Player response JSON, as returned by the youtubei player endpoint.
+
+    Returns:
+        CaptionsData object containing the caption tracks.
+
+    Raises:
+        InitialPlayerResponseNotFoundError: If data is not a JSON object.
+        CaptionsNotFoundError: If the video is playable but has no caption tracks.
+        VideoUnplayableError: If the response has no caption tracks because the video is not playable
+            for this client, e.g. it requires login or is unavailable.
+    """
+    try:
+        response_json = json_loads(data)
+    except ValueError as e:
+        raise InitialPlayerResponseNotFoundError() from e
+    if not isinstance(response_json, dict):
+        raise InitialPlayerResponseNotFoundError()
 
-    captions_json = response_json.get("captions", {}).get("playerCaptionsTracklistRenderer")
+    captions_json = (response_json.get("captions") or {}).get("playerCaptionsTracklistRenderer")
     if not captions_json or "captionTracks" not in captions_json:
-        raise CaptionsNotFoundError()
+        _raise_missing_captions(response_json)
 
-    return Captions.model_validate(captions_json)
+    return CaptionsData.from_json(captions_json)
 
 
 async def fetch_video_html(video_id: str) -> str:
     """Fetch YouTube video page HTML by video ID.
 
+    Delegates to the default TranscriptClient for the running event loop.
+
     Args:
         video_id: YouTube video ID (11 characters).
 
@@ -97,21 +271,14 @@ async def fetch_video_html(video_id: str) -> str:
     Raises:
         httpx.HTTPError: If the request fails.
     """
-    return await fetch_html(WATCH_URL, params={"v": video_id})
+    return await get_default_client().fetch_video_html(video_id)
 
 
-@retry(
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=1, max=10),
-    retry=retry_if_exception_type((httpx.ConnectError, httpx.TimeoutException, httpx.NetworkError)),
-    reraise=True,
-)
 async def fetch_html(url: str, params=None) -> str:
     """Fetch HTML content from a URL with automatic retry on network errors.
 
-    Automatically retries up to 3 times with exponential backoff (1s, 2s, 4s)
-    for network-related errors (ConnectError, TimeoutException, NetworkError).
-    HTTP status errors (4xx, 5xx) are not retried.
+    Delegates to the default TranscriptClient for the running event loop,
+    so consecutive calls reuse pooled keep-alive connections.
 
     Args:
         url: The URL to fetch.
@@ -123,14 +290,12 @@ async def fetch_html(url: str, params=None) -> str:
     Raises:
         httpx.HTTPError: If the request fails after retries or encounters HTTP status errors.
     """
-    logger.debug(f"Fetching URL: {url}")
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url=url, params=params)
-        response.raise_for_status()
-        return response.text
+    return await get_default_client().fetch_html(url, params=params)
 
 
-def get_caption_track(caption_tracks: list[CaptionTrack], language_codes: str | Iterable[str]) -> CaptionTrack:
+def get_caption_track[T: (CaptionTrack, CaptionTrackData)](
+    caption_tracks: list[T], language_codes: str | Iterable[str]
+) -> T:
     """Select a caption track based on language preferences.
 
     Selects the first available caption track that matches the requested
@@ -164,46 +329,1306 @@ def get_caption_track(caption_tracks: list[CaptionTrack], language_codes: str |
     return caption_tracks[0]
 
 
-def parse_transcript(xml: str) -> list[TranscriptSnippet]:
+async def _aiter(items: Iterable[str] | AsyncIterable[str]) -> AsyncIterator[str]:
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+def _caption_urls_expire_at(captions: CaptionsData) -> float | None:
+    """Return the earliest expiry timestamp signed into the caption track URLs, if any."""
+    expires = []
+    for caption_track in captions.caption_tracks:
+        if caption_track.base_url is None:
+            continue
+        expire = parse_qs(urlsplit(caption_track.base_url).query).get("expire")
+        if expire and expire[0].isdigit():
+            expires.append(float(expire[0]))
+    return min(expires, default=None)
+
+
+def _normalize_language_codes(language_codes: str | Iterable[str]) -> tuple[str, ...]:
+    if isinstance(language_codes, str):
+        return (language_codes,)
+    return tuple(language_codes)
+
+
+@overload
+def parse_transcript(xml: str, output: Literal["model"] = "model") -> list[TranscriptSnippet]: ...
+
+
+@overload
+def parse_transcript(xml: str, output: Literal["compact"]) -> list[CompactSnippet]: ...
+
+
+@overload
+def parse_transcript(xml: str, output: Literal["table"]) -> TranscriptTable: ...
+
+
+def parse_transcript(xml: str, output: TranscriptOutput = "model") -> Transcript:
     """Parse transcript XML into structured snippets.
 
     Parses YouTube caption track XML format into TranscriptSnippet objects.
-    HTML entities in text are automatically decoded.
+    HTML entities in text are automatically decoded. The XML is parsed with
+    lxml when it is installed (see aioytt.xml_backend).
 
     Args:
         xml: Caption track XML content.
+        output: "model" for TranscriptSnippet objects, "compact" for CompactSnippet tuples,
+            "table" for a columnar TranscriptTable.
 
     Returns:
-        List of transcript snippets with text and timing information.
+        List of transcript snippets with text and timing information, or a TranscriptTable.
+    """
+    rows = _iter_transcript_rows(xml)
+    if output == "table":
+        return TranscriptTable.from_rows(rows)
+    return _convert_transcript([CompactSnippet._make(row) for row in rows], output)
+
+
+def _iter_transcript_rows(xml: str) -> Iterator[tuple[str, float, float]]:
+    for xml_element in xml_fromstring(xml):
+        row = _transcript_row(xml_element)
+        if row is not None:
+            yield row
+
+
+def _transcript_row(xml_element: ElementTree.Element) -> tuple[str, float, float] | None:
+    text = xml_element.text
+    if text is None:
+        return None
+
+    return (
+        unescape(text.strip()),
+        float(xml_element.attrib["start"]),
+        float(xml_element.attrib.get("dur", "0.0")),
+    )
+
+
+@overload
+def parse_transcript_json3(data: str | bytes, output: Literal["model"] = "model") -> list[TranscriptSnippet]: ...
+
+
+@overload
+def parse_transcript_json3(data: str | bytes, output: Literal["compact"]) -> list[CompactSnippet]: ...
+
+
+@overload
+def parse_transcript_json3(data: str | bytes, output: Literal["table"]) -> TranscriptTable: ...
+
+
+def parse_transcript_json3(data: str | bytes, output: TranscriptOutput = "model") -> Transcript:
+    """Parse a caption track downloaded with fmt=json3 into structured snippets.
+
+    Each event with text segments becomes one snippet; events without
+    segments (window and style definitions) and line-break-only events are
+    skipped.
+
+    Args:
+        data: Caption track JSON content.
+        output: "model" for TranscriptSnippet objects, "compact" for CompactSnippet tuples,
+            "table" for a columnar TranscriptTable.
+
+    Returns:
+        List of transcript snippets with text and timing information, or a TranscriptTable.
     """
-    transcript_snippets = []
-    for xml_element in ElementTree.fromstring(xml):
-        text = xml_element.text
-        if text is None:
+    rows = _iter_json3_rows(json_loads(data))
+    if output == "table":
+        return TranscriptTable.from_rows(rows)
+    return _convert_transcript([CompactSnippet._make(row) for row in rows], output)
+
+
+def _iter_json3_rows(transcript_json: dict) -> Iterator[tuple[str, float, float]]:
+    for event in transcript_json.get("events", ()):
+        segs = event.get("segs")
+        if not segs:
+            continue
+
+        text = "".join(seg.get("utf8", "") for seg in segs).strip()
+        if not text:
             continue
 
-        transcript_snippets.append(
-            TranscriptSnippet(
-                text=unescape(text.strip()),
-                start=float(xml_element.attrib["start"]),
-                duration=float(xml_element.attrib.get("dur", "0.0")),
+        yield text, event.get("tStartMs", 0) / 1000, event.get("dDurationMs", 0) / 1000
+
+
+@overload
+def parse_transcript_srv3(
+    xml: str | bytes, output: Literal["model"] = "model", *, words: bool = ...
+) -> list[TranscriptSnippet]: ...
+
+
+@overload
+def parse_transcript_srv3(
+    xml: str | bytes, output: Literal["compact"], *, words: bool = ...
+) -> list[CompactSnippet]: ...
+
+
+@overload
+def parse_transcript_srv3(xml: str | bytes, output: Literal["table"], *, words: bool = ...) -> TranscriptTable: ...
+
+
+def parse_transcript_srv3(xml: str | bytes, output: TranscriptOutput = "model", *, words: bool = False) -> Transcript:
+    """Parse a caption track downloaded with fmt=srv3 into structured snippets.
+
+    srv3 stores times in milliseconds on <p t="..." d="..."> elements, and
+    automatic captions split each line into <s> word segments with offsets
+    relative to their line. By default each line becomes one snippet; with
+    words=True each word segment becomes its own snippet, lasting until the
+    next word starts or its line ends.
+
+    Args:
+        xml: Caption track srv3 XML content.
+        output: "model" for TranscriptSnippet objects, "compact" for CompactSnippet tuples,
+            "table" for a columnar TranscriptTable.
+        words: Whether to return one snippet per word segment instead of per line.
+
+    Returns:
+        List of transcript snippets with text and timing information, or a TranscriptTable.
+
+    Example:
+        >>> words = parse_transcript_srv3(xml, output="compact", words=True)
+    """
+    rows = _iter_srv3_rows(xml, words)
+    if output == "table":
+        return TranscriptTable.from_rows(rows)
+    return _convert_transcript([CompactSnippet._make(row) for row in rows], output)
+
+
+def _iter_srv3_rows(xml: str | bytes, words: bool) -> Iterator[tuple[str, float, float]]:
+    for paragraph in xml_fromstring(xml).iter("p"):
+        start = int(paragraph.attrib.get("t", "0"))
+        end = start + int(paragraph.attrib.get("d", "0"))
+
+        if not words:
+            text = unescape("".join(paragraph.itertext()).strip())
+            if text:
+                yield text, start / 1000, (end - start) / 1000
+            continue
+
+        segments = [
+            (start + int(segment.attrib.get("t", "0")), unescape("".join(segment.itertext()).strip()))
+            for segment in paragraph.iter("s")
+        ]
+        if not segments and paragraph.text:
+            segments = [(start, unescape(paragraph.text.strip()))]
+
+        for index, (word_start, text) in enumerate(segments):
+            if not text:
+                continue
+            word_end = segments[index + 1][0] if index + 1 < len(segments) else end
+            yield text, word_start / 1000, max(word_end - word_start, 0) / 1000
+
+
+def _parse_caption_body(body: str, caption_format: CaptionFormat, words: bool = False) -> list[CompactSnippet]:
+    if caption_format == "json3":
+        return parse_transcript_json3(body, output="compact")
+    if caption_format == "srv3":
+        return parse_transcript_srv3(body, output="compact", words=words)
+    return parse_transcript(body, output="compact")
+
+
+def _check_words(caption_format: CaptionFormat, words: bool) -> None:
+    # Only srv3 carries word segments; srv1 and json3 would silently return lines.
+    if words and caption_format != "srv3":
+        raise ValueError(f'words=True requires caption_format="srv3", got "{caption_format}"')
+
+
+def _caption_url(base_url: str, caption_format: CaptionFormat, translate_to: str | None = None) -> str:
+    params = {}
+    # base_url already returns srv1, so it is left untouched for the default format.
+    if caption_format != "srv1":
+        params["fmt"] = caption_format
+    if translate_to is not None:
+        params["tlang"] = translate_to
+    if not params:
+        return base_url
+    return str(httpx.URL(base_url).copy_merge_params(params))
+
+
+def _translation_target(
+    captions: CaptionsData, caption_track: CaptionTrackData, translate_to: str | None
+) -> str | None:
+    """Return the tlang to request for caption_track, or None if no translation is needed."""
+    if translate_to is None or caption_track.language_code == translate_to:
+        return None
+
+    if not caption_track.is_translatable:
+        raise TranslationNotAvailableError(translate_to)
+    # Older player responses omit the list; let YouTube decide in that case.
+    if captions.translation_language_codes and translate_to not in captions.translation_language_codes:
+        raise TranslationNotAvailableError(translate_to)
+    return translate_to
+
+
+class _TranscriptPullParser:
+    """Incremental caption XML parser that drops each snippet element once it is read."""
+
+    def __init__(self) -> None:
+        self._parser = ElementTree.XMLPullParser(events=("start", "end"))
+        self._root: ElementTree.Element | None = None
+        self._depth = 0
+
+    def feed(self, data: str | bytes) -> Iterator[CompactSnippet]:
+        self._parser.feed(data)
+        return self._read_events()
+
+    def close(self) -> Iterator[CompactSnippet]:
+        self._parser.close()
+        return self._read_events()
+
+    def _read_events(self) -> Iterator[CompactSnippet]:
+        for event, xml_element in self._parser.read_events():
+            if event == "start":
+                if self._root is None:
+                    self._root = xml_element
+                self._depth += 1
+                continue
+
+            self._depth -= 1
+            if self._depth != 1 or self._root is None:
+                continue
+
+            row = _transcript_row(xml_element)
+            # Snippets are direct children of the root; clearing it releases the ones already read.
+            self._root.clear()
+            if row is not None:
+                yield CompactSnippet._make(row)
+
+
+def iter_parse_transcript(chunks: Iterable[str | bytes]) -> Iterator[CompactSnippet]:
+    """Parse transcript XML incrementally, yielding snippets as their elements close.
+
+    Produces the same snippets as parse_transcript(xml, output="compact"), but
+    consumes the XML in chunks and releases each element after it is read, so
+    memory stays constant for very long caption tracks.
+
+    Args:
+        chunks: Caption track XML content, split into chunks of text or bytes.
+
+    Yields:
+        Transcript snippets in document order.
+    """
+    parser = _TranscriptPullParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+async def aiter_parse_transcript(chunks: AsyncIterable[str | bytes]) -> AsyncIterator[CompactSnippet]:
+    """Async version of iter_parse_transcript() for chunks read from a response stream.
+
+    Args:
+        chunks: Caption track XML content, split into chunks of text or bytes.
+
+    Yields:
+        Transcript snippets in document order.
+    """
+    parser = _TranscriptPullParser()
+    async for chunk in chunks:
+        for snippet in parser.feed(chunk):
+            yield snippet
+    for snippet in parser.close():
+        yield snippet
+
+
+def _convert_transcript(snippets: list[CompactSnippet], output: TranscriptOutput) -> Transcript:
+    if output == "compact":
+        return list(snippets)
+    if output == "table":
+        return TranscriptTable.from_rows(snippets)
+    return [snippet.to_model() for snippet in snippets]
+
+
+def _is_throttled(exception: BaseException) -> bool:
+    return isinstance(exception, httpx.HTTPStatusError) and exception.response.status_code in THROTTLE_STATUS_CODES
+
+
+_wait_exponential = wait_exponential(multiplier=1, min=1, max=10)
+
+
+def _wait_for_retry(retry_state: RetryCallState) -> float:
+    exception = retry_state.outcome.exception() if retry_state.outcome else None
+    if isinstance(exception, httpx.HTTPStatusError):
+        retry_after = parse_retry_after(exception.response.headers.get("Retry-After"))
+        if retry_after is not None:
+            return min(retry_after, MAX_RETRY_AFTER)
+    return _wait_exponential(retry_state)
+
+
+_retry_requests = retry(
+    stop=stop_after_attempt(3),
+    wait=_wait_for_retry,
+    retry=(
+        retry_if_exception_type((httpx.ConnectError, httpx.TimeoutException, httpx.NetworkError))
+        | retry_if_exception(_is_throttled)
+    ),
+    reraise=True,
+)
+
+
+class TranscriptClient:
+    """Session that reuses one pooled HTTP client across transcript requests.
+
+    The underlying httpx.AsyncClient keeps connections alive between the
+    watch page and caption requests, so repeated fetches skip the TCP and
+    TLS handshakes. A client is bound to the event loop it is first used on.
+
+    Args:
+        max_connections: Maximum number of concurrent connections.
+        max_keepalive_connections: Maximum number of idle connections kept in the pool.
+        keepalive_expiry: Seconds an idle connection is kept before being closed.
+        timeout: Request timeout in seconds.
+        http_client: Optional preconfigured httpx.AsyncClient. It is not closed by aclose().
+        rate_limiter: Optional rate limiter awaited before every request, per host.
+        captions_cache: Optional cache of parsed captions keyed by video ID.
+        transcript_cache: Optional persistent cache of transcripts, checked before any network request.
+        negative_cache: Optional cache of videos whose page has no player response or no captions.
+            Usually given a shorter ttl than captions_cache.
+        stream_watch_page: Stop downloading the watch page once ytInitialPlayerResponse is complete.
+            This saves the rest of the page but closes the connection instead of returning it to
+            the pool, so the next request pays for a new TLS handshake. Disabled by default.
+        parse_executor: Optional executor that parses watch pages and caption tracks off the event loop.
+            A ThreadPoolExecutor keeps the loop responsive; a ProcessPoolExecutor also spreads parsing
+            over all cores, but worker processes pick their JSON and XML backends from the environment.
+            It is not shut down by aclose().
+        parse_offload_threshold: Payloads shorter than this many characters are parsed inline,
+            where the executor round trip would cost more than the parse.
+        caption_source: "watch_page" to discover caption tracks by scraping the watch page, or
+            "innertube" to POST to the youtubei player endpoint, which returns only the player
+            response JSON.
+        innertube_url: Player endpoint used when caption_source is "innertube".
+        innertube_context: InnerTube client context sent with player requests. Defaults to
+            DEFAULT_INNERTUBE_CONTEXT.
+        selection_policy: Optional track sources to accept, in order of preference, e.g.
+            ("manual", "asr", "translated"). When set, tracks are chosen with CaptionTrackIndex,
+            which also matches base languages, and CaptionsNotFoundError is raised when no track
+            satisfies the policy. By default get_caption_track() is used, which falls back to the
+            first track.
+
+    Example:
+        >>> async with TranscriptClient(max_connections=50) as client:
+        ...     transcript = await client.get_transcript_from_video_id("dQw4w9WgXcQ")
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 5.0,
+        timeout: float = 5.0,
+        http_client: httpx.AsyncClient | None = None,
+        rate_limiter: RateLimiter | None = None,
+        captions_cache: TTLCache[str, CaptionsData] | None = None,
+        transcript_cache: SQLiteTranscriptCache | None = None,
+        negative_cache: TTLCache[str, type[AioyttError]] | None = None,
+        stream_watch_page: bool = False,
+        parse_executor: Executor | None = None,
+        parse_offload_threshold: int = DEFAULT_PARSE_OFFLOAD_THRESHOLD,
+        caption_source: CaptionSource = "watch_page",
+        innertube_url: str = INNERTUBE_PLAYER_URL,
+        innertube_context: dict[str, Any] | None = None,
+        selection_policy: Iterable[TrackSource] | None = None,
+    ) -> None:
+        if caption_source not in ("watch_page", "innertube"):
+            raise ValueError(f"unknown caption source: {caption_source}, expected watch_page or innertube")
+
+        self._rate_limiter = rate_limiter
+        self._captions_cache = captions_cache
+        self._transcript_cache = transcript_cache
+        self._negative_cache = negative_cache
+        self._stream_watch_page = stream_watch_page
+        self._parse_executor = parse_executor
+        self._parse_offload_threshold = parse_offload_threshold
+        self._caption_source = caption_source
+        self._innertube_url = innertube_url
+        self._innertube_context = DEFAULT_INNERTUBE_CONTEXT if innertube_context is None else innertube_context
+        self._selection_policy = None if selection_policy is None else validate_selection_policy(selection_policy)
+        self._in_flight: SingleFlight[list[CompactSnippet]] = SingleFlight()
+        self._captions_in_flight: SingleFlight[CaptionsData] = SingleFlight()
+        self._owns_http_client = http_client is None
+        if http_client is None:
+            limits = httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            )
+            http_client = httpx.AsyncClient(limits=limits, timeout=timeout)
+        self._http_client = http_client
+
+    async def __aenter__(self) -> TranscriptClient:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client if it is owned by this session."""
+        if self._owns_http_client:
+            await self._http_client.aclose()
+
+    @_retry_requests
+    async def fetch_html(self, url: str, params=None) -> str:
+        """Fetch HTML content from a URL with automatic retry on network errors.
+
+        Automatically retries up to 3 times with exponential backoff (1s, 2s, 4s)
+        for network-related errors (ConnectError, TimeoutException, NetworkError)
+        and throttling responses (429, 503), honouring Retry-After when present.
+        Other HTTP status errors are not retried. Every attempt waits for the
+        rate limiter, if one is configured, and reports the response back to it.
+
+        Args:
+            url: The URL to fetch.
+            params: Optional query parameters.
+
+        Returns:
+            HTML content as string.
+
+        Raises:
+            httpx.HTTPError: If the request fails after retries or encounters HTTP status errors.
+        """
+        logger.debug(f"Fetching URL: {url}")
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire(httpx.URL(url).host)
+
+        sent_at = time.monotonic()
+        response = await self._http_client.get(url=url, params=params)
+        self._report_response(response, sent_at)
+        response.raise_for_status()
+        return response.text
+
+    @_retry_requests
+    async def _fetch_player_response_html(self, url: str, params=None) -> str:
+        """Stream a watch page and stop reading once ytInitialPlayerResponse is complete.
+
+        The page is read in chunks until the script element holding the player
+        response is closed; the rest of the document is never downloaded.
+        Retries and rate limiting behave as in fetch_html().
+        """
+        logger.debug(f"Streaming URL: {url}")
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire(httpx.URL(url).host)
+
+        sent_at = time.monotonic()
+        async with self._http_client.stream("GET", url, params=params) as response:
+            self._report_response(response, sent_at)
+            response.raise_for_status()
+
+            html = ""
+            search_from = 0
+            marker_found = False
+            async for chunk in response.aiter_text():
+                html += chunk
+
+                if not marker_found:
+                    index = html.find(PLAYER_RESPONSE_MARKER, search_from)
+                    if index < 0:
+                        search_from = max(0, len(html) - len(PLAYER_RESPONSE_MARKER) + 1)
+                        continue
+                    marker_found = True
+                    search_from = index + len(PLAYER_RESPONSE_MARKER)
+
+                if html.find(_SCRIPT_END, search_from) >= 0:
+                    logger.debug(f"Found ytInitialPlayerResponse after {len(html)} characters, closing stream")
+                    return html
+                search_from = max(search_from, len(html) - len(_SCRIPT_END) + 1)
+
+            return html
+
+    def _report_response(self, response: httpx.Response, sent_at: float) -> None:
+        if self._rate_limiter is None:
+            return
+
+        host = response.request.url.host
+        if response.status_code in THROTTLE_STATUS_CODES:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            self._rate_limiter.on_throttle(host, retry_after, sent_at=sent_at)
+        elif response.is_success:
+            self._rate_limiter.on_success(host)
+
+    async def fetch_video_html(self, video_id: str) -> str:
+        """Fetch YouTube video page HTML by video ID.
+
+        When stream_watch_page is enabled, the returned HTML ends shortly after
+        the ytInitialPlayerResponse script instead of covering the whole page.
+
+        Args:
+            video_id: YouTube video ID (11 characters).
+
+        Returns:
+            HTML content of the video page.
+
+        Raises:
+            httpx.HTTPError: If the request fails.
+        """
+        if self._stream_watch_page:
+            return await self._fetch_player_response_html(WATCH_URL, params={"v": video_id})
+        return await self.fetch_html(WATCH_URL, params={"v": video_id})
+
+    @_retry_requests
+    async def fetch_player_response(self, video_id: str) -> bytes:
+        """Fetch the player response JSON of a video from the InnerTube player endpoint.
+
+        Only the player response is transferred, instead of a full watch page.
+        Retries and rate limiting behave as in fetch_html().
+
+        Args:
+            video_id: YouTube video ID (11 characters).
+
+        Returns:
+            Raw player response JSON.
+
+        Raises:
+            httpx.HTTPError: If the request fails.
+        """
+        logger.debug(f"Fetching player response: {video_id}")
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire(httpx.URL(self._innertube_url).host)
+
+        sent_at = time.monotonic()
+        response = await self._http_client.post(
+            self._innertube_url,
+            json={"context": self._innertube_context, "videoId": video_id, "contentCheckOk": True, "racyCheckOk": True},
+        )
+        self._report_response(response, sent_at)
+        response.raise_for_status()
+        return response.content
+
+    @overload
+    async def get_transcript_from_video_id(
+        self,
+        video_id: str,
+        language_codes: str | Iterable[str] = ...,
+        output: Literal["model"] = ...,
+        *,
+        caption_format: CaptionFormat = ...,
+        translate_to: str | None = ...,
+        words: bool = ...,
+    ) -> list[TranscriptSnippet]: ...
+
+    @overload
+    async def get_transcript_from_video_id(
+        self,
+        video_id: str,
+        language_codes: str | Iterable[str] = ...,
+        *,
+        output: Literal["compact"],
+        caption_format: CaptionFormat = ...,
+        translate_to: str | None = ...,
+        words: bool = ...,
+    ) -> list[CompactSnippet]: ...
+
+    @overload
+    async def get_transcript_from_video_id(
+        self,
+        video_id: str,
+        language_codes: str | Iterable[str] = ...,
+        *,
+        output: Literal["table"],
+        caption_format: CaptionFormat = ...,
+        translate_to: str | None = ...,
+        words: bool = ...,
+    ) -> TranscriptTable: ...
+
+    async def get_transcript_from_video_id(
+        self,
+        video_id: str,
+        language_codes: str | Iterable[str] = ("en",),
+        output: TranscriptOutput = "model",
+        *,
+        caption_format: CaptionFormat = "srv1",
+        translate_to: str | None = None,
+        words: bool = False,
+    ) -> Transcript:
+        """Extract transcript from a YouTube video by video ID.
+
+        Concurrent calls for the same video and language preference share one
+        fetch and parse; each caller receives its own list.
+
+        Args:
+            video_id: YouTube video ID (11 characters).
+            language_codes: Language code(s) in priority order. Defaults to English ("en").
+            output: "model" for TranscriptSnippet objects, "compact" for CompactSnippet tuples,
+                "table" for a columnar TranscriptTable.
+            caption_format: Timedtext format to download: "srv1" (default XML), "srv3" or "json3".
+            translate_to: Language code to machine-translate the selected track into, using the
+                track's own base_url. Ignored when the selected track is already in that language.
+            words: With caption_format="srv3", return one snippet per word segment instead of per line.
+
+        Returns:
+            List of transcript snippets with text and timing information.
+
+        Raises:
+            CaptionsNotFoundError: If no captions are available or no base URL found.
+            TranslationNotAvailableError: If the selected track cannot be translated into translate_to.
+            ValueError: If words is set and caption_format is not "srv3".
+            httpx.HTTPError: If network requests fail.
+        """
+        _check_words(caption_format, words)
+        language_codes = _normalize_language_codes(language_codes)
+        transcript = await self._in_flight.do(
+            (video_id, language_codes, caption_format, translate_to, words),
+            lambda: self._fetch_transcript(video_id, language_codes, caption_format, translate_to, words),
+        )
+        return _convert_transcript(transcript, output)
+
+    async def get_captions(self, video_id: str) -> Captions:
+        """Fetch and parse the caption tracks of a video.
+
+        Results are served from the captions cache when one is configured.
+        Cached entries never outlive the expiry signed into the tracks' base
+        URLs. Videos known to have no captions are rejected from the negative
+        cache without a request. Concurrent calls for the same video share one
+        download.
+
+        Args:
+            video_id: YouTube video ID (11 characters).
+
+        Returns:
+            Captions object containing caption tracks and audio tracks.
+
+        Raises:
+            InitialPlayerResponseNotFoundError: If ytInitialPlayerResponse variable not found.
+            CaptionsNotFoundError: If no caption tracks found in the response.
+            httpx.HTTPError: If the request fails.
+        """
+        captions = await self._get_captions_data(video_id)
+        return captions.to_model()
+
+    async def _get_captions_data(self, video_id: str) -> CaptionsData:
+        if self._negative_cache is not None:
+            error_type = self._negative_cache.get(video_id)
+            if error_type is not None:
+                logger.debug(f"Negative cache hit: {video_id}")
+                raise error_type()
+
+        if self._captions_cache is not None:
+            captions = self._captions_cache.get(video_id)
+            if captions is not None:
+                logger.debug(f"Captions cache hit: {video_id}")
+                return captions
+
+        return await self._captions_in_flight.do(video_id, lambda: self._fetch_captions(video_id))
+
+    def _select_caption_track(
+        self, captions: CaptionsData, language_codes: tuple[str, ...], translate_to: str | None
+    ) -> tuple[CaptionTrackData, str | None]:
+        """Return the caption track to fetch and the tlang to request for it, if any."""
+        if self._selection_policy is None:
+            caption_track = get_caption_track(captions.caption_tracks, language_codes)
+        else:
+            index = CaptionTrackIndex(captions.caption_tracks, captions.translation_language_codes)
+            selection = index.select(language_codes, self._selection_policy)
+            if selection is None:
+                raise CaptionsNotFoundError()
+            caption_track = selection.caption_track
+            if translate_to is None:
+                translate_to = selection.translate_to
+
+        return caption_track, _translation_target(captions, caption_track, translate_to)
+
+    async def _fetch_caption_track(
+        self,
+        caption_track: CaptionTrackData,
+        caption_format: CaptionFormat,
+        translate_to: str | None = None,
+        words: bool = False,
+    ) -> list[CompactSnippet]:
+        base_url = caption_track.base_url
+        if base_url is None:
+            raise CaptionsNotFoundError()
+
+        body = await self.fetch_html(_caption_url(base_url, caption_format, translate_to))
+        return await self._parse(_parse_caption_body, body, caption_format, words)
+
+    async def _parse[R](self, parser: Callable[..., R], data: str | bytes, *args: object) -> R:
+        """Run parser on data, in the parse executor when data is large enough to be worth it."""
+        if self._parse_executor is None or len(data) < self._parse_offload_threshold:
+            return parser(data, *args)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._parse_executor, functools.partial(parser, data, *args))
+
+    async def _fetch_captions(self, video_id: str) -> CaptionsData:
+        if self._caption_source == "innertube":
+            data, parser = await self.fetch_player_response(video_id), parse_player_response_captions
+        else:
+            data, parser = await self.fetch_video_html(video_id), parse_captions_data
+
+        try:
+            captions = await self._parse(parser, data)
+        except NEGATIVE_CACHEABLE_ERRORS as e:
+            if self._negative_cache is not None:
+                self._negative_cache.set(video_id, type(e))
+            raise
+
+        if self._captions_cache is not None:
+            ttl = self._captions_cache.ttl
+            expires_at = _caption_urls_expire_at(captions)
+            if expires_at is not None:
+                ttl = min(ttl, expires_at - time.time() - CAPTION_URL_EXPIRY_MARGIN)
+            self._captions_cache.set(video_id, captions, ttl=ttl)
+
+        return captions
+
+    async def _fetch_transcript(
+        self,
+        video_id: str,
+        language_codes: tuple[str, ...],
+        caption_format: CaptionFormat = "srv1",
+        translate_to: str | None = None,
+        words: bool = False,
+    ) -> list[CompactSnippet]:
+        if self._transcript_cache is not None:
+            transcript = await asyncio.to_thread(
+                self._transcript_cache.get,
+                video_id,
+                language_codes,
+                caption_format,
+                translate_to,
+                self._selection_policy,
+                words,
+            )
+            if transcript is not None:
+                logger.debug(f"Transcript cache hit: {video_id}")
+                return transcript
+
+        captions = await self._get_captions_data(video_id)
+
+        # The cache is keyed by the requested translate_to, not the tlang it resolves to.
+        caption_track, tlang = self._select_caption_track(captions, language_codes, translate_to)
+        transcript = await self._fetch_caption_track(caption_track, caption_format, tlang, words)
+
+        if self._transcript_cache is not None:
+            await asyncio.to_thread(
+                self._transcript_cache.set,
+                video_id,
+                language_codes,
+                transcript,
+                caption_format=caption_format,
+                translate_to=translate_to,
+                selection_policy=self._selection_policy,
+                words=words,
+                vss_id=caption_track.vss_id,
+                language_code=caption_track.language_code,
+            )
+
+        return transcript
+
+    @overload
+    async def get_transcript_from_url(
+        self,
+        url: str,
+        language_codes: str | Iterable[str] = ...,
+        output: Literal["model"] = ...,
+        *,
+        caption_format: CaptionFormat = ...,
+        translate_to: str | None = ...,
+        words: bool = ...,
+    ) -> list[TranscriptSnippet]: ...
+
+    @overload
+    async def get_transcript_from_url(
+        self,
+        url: str,
+        language_codes: str | Iterable[str] = ...,
+        *,
+        output: Literal["compact"],
+        caption_format: CaptionFormat = ...,
+        translate_to: str | None = ...,
+        words: bool = ...,
+    ) -> list[CompactSnippet]: ...
+
+    @overload
+    async def get_transcript_from_url(
+        self,
+        url: str,
+        language_codes: str | Iterable[str] = ...,
+        *,
+        output: Literal["table"],
+        caption_format: CaptionFormat = ...,
+        translate_to: str | None = ...,
+        words: bool = ...,
+    ) -> TranscriptTable: ...
+
+    async def get_transcript_from_url(
+        self,
+        url: str,
+        language_codes: str | Iterable[str] = ("en",),
+        output: TranscriptOutput = "model",
+        *,
+        caption_format: CaptionFormat = "srv1",
+        translate_to: str | None = None,
+        words: bool = False,
+    ) -> Transcript:
+        """Extract transcript from a YouTube video by URL.
+
+        Args:
+            url: YouTube video URL.
+            language_codes: Language code(s) in priority order. Defaults to English ("en").
+            output: "model" for TranscriptSnippet objects, "compact" for CompactSnippet tuples,
+                "table" for a columnar TranscriptTable.
+            caption_format: Timedtext format to download: "srv1" (default XML), "srv3" or "json3".
+            translate_to: Language code to machine-translate the selected track into, using the
+                track's own base_url. Ignored when the selected track is already in that language.
+            words: With caption_format="srv3", return one snippet per word segment instead of per line.
+
+        Returns:
+            List of transcript snippets with text and timing information.
+
+        Raises:
+            VideoIDError: If the URL contains an invalid video ID.
+            CaptionsNotFoundError: If no captions are available.
+            httpx.HTTPError: If network requests fail.
+        """
+        video_id = parse_video_id(url)
+        return await self.get_transcript_from_video_id(
+            video_id,
+            language_codes,
+            output=output,
+            caption_format=caption_format,
+            translate_to=translate_to,
+            words=words,
+        )
+
+    async def get_transcripts_by_language(
+        self,
+        video_id: str,
+        language_codes: str | Iterable[str] | None = None,
+        *,
+        output: TranscriptOutput = "model",
+        caption_format: CaptionFormat = "srv1",
+        words: bool = False,
+    ) -> dict[str, Transcript]:
+        """Extract several caption tracks of one video from a single watch page fetch.
+
+        The selected tracks are downloaded concurrently over the shared
+        connection pool. With language_codes, the first track of each
+        requested language is fetched and the result is keyed by language
+        code; languages the video has no track for are left out rather than
+        falling back to another track. When the client has a selection_policy,
+        each language's track is chosen by it instead, possibly as a machine
+        translation. Without language_codes, every track is fetched and the
+        result is keyed by vss_id, so manual (".en") and automatic ("a.en")
+        tracks of the same language are kept apart. The transcript cache is
+        not consulted.
+
+        Args:
+            video_id: YouTube video ID (11 characters).
+            language_codes: Language code(s) to fetch, or None for all tracks.
+            output: "model" for TranscriptSnippet objects, "compact" for CompactSnippet tuples,
+                "table" for a columnar TranscriptTable.
+            caption_format: Timedtext format to download: "srv1" (default XML), "srv3" or "json3".
+            words: With caption_format="srv3", return one snippet per word segment instead of per line.
+
+        Returns:
+            Transcripts keyed by language code, or by vss_id when language_codes is None.
+
+        Raises:
+            CaptionsNotFoundError: If no captions are available or a selected track has no base URL.
+            httpx.HTTPError: If network requests fail.
+
+        Example:
+            >>> transcripts = await client.get_transcripts_by_language("dQw4w9WgXcQ", ["ja", "en"])
+            >>> original, english = transcripts.get("ja"), transcripts.get("en")
+        """
+        _check_words(caption_format, words)
+        captions = await self._get_captions_data(video_id)
+
+        # Each selected track is paired with the tlang to request it with, if any.
+        selected: dict[str, tuple[CaptionTrackData, str | None]] = {}
+        if language_codes is None:
+            for caption_track in captions.caption_tracks:
+                key = caption_track.vss_id or caption_track.language_code
+                if key is not None:
+                    selected.setdefault(key, (caption_track, None))
+        elif self._selection_policy is not None:
+            index = CaptionTrackIndex(captions.caption_tracks, captions.translation_language_codes)
+            for language_code in _normalize_language_codes(language_codes):
+                selection = index.select([language_code], self._selection_policy)
+                if selection is not None:
+                    selected.setdefault(language_code, (selection.caption_track, selection.translate_to))
+        else:
+            for language_code in _normalize_language_codes(language_codes):
+                for caption_track in captions.caption_tracks:
+                    if caption_track.language_code == language_code:
+                        selected.setdefault(language_code, (caption_track, None))
+                        break
+
+        transcripts = await asyncio.gather(
+            *(
+                self._fetch_caption_track(caption_track, caption_format, translate_to, words)
+                for caption_track, translate_to in selected.values()
             )
         )
-    return transcript_snippets
+        return {
+            key: _convert_transcript(transcript, output) for key, transcript in zip(selected, transcripts, strict=True)
+        }
+
+    async def stream_transcript(
+        self, video_id: str, language_codes: str | Iterable[str] = ("en",)
+    ) -> AsyncIterator[CompactSnippet]:
+        """Stream a transcript, yielding snippets while the caption track downloads.
+
+        The caption XML is parsed incrementally from the response body, so the
+        first snippets are available before the download finishes and memory
+        stays constant for multi-hour tracks. The transcript cache and request
+        coalescing are bypassed, and the caption request is not retried once
+        streaming has started.
+
+        Args:
+            video_id: YouTube video ID (11 characters).
+            language_codes: Language code(s) in priority order. Defaults to English ("en").
+
+        Yields:
+            Transcript snippets in document order.
+
+        Raises:
+            CaptionsNotFoundError: If no captions are available or no base URL found.
+            httpx.HTTPError: If network requests fail.
+
+        Example:
+            >>> async for snippet in client.stream_transcript("dQw4w9WgXcQ"):
+            ...     print(snippet.start, snippet.text)
+        """
+        captions = await self._get_captions_data(video_id)
+
+        caption_track, translate_to = self._select_caption_track(
+            captions, _normalize_language_codes(language_codes), None
+        )
+
+        base_url = caption_track.base_url
+        if base_url is None:
+            raise CaptionsNotFoundError()
+
+        url = _caption_url(base_url, "srv1", translate_to)
+        logger.debug(f"Streaming URL: {url}")
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire(httpx.URL(url).host)
+
+        sent_at = time.monotonic()
+        async with self._http_client.stream("GET", url) as response:
+            self._report_response(response, sent_at)
+            response.raise_for_status()
+            async for snippet in aiter_parse_transcript(response.aiter_bytes()):
+                yield snippet
+
+    async def get_transcripts(
+        self,
+        videos: Iterable[str],
+        language_codes: str | Iterable[str] = ("en",),
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        output: TranscriptOutput = "model",
+        caption_format: CaptionFormat = "srv1",
+        translate_to: str | None = None,
+        words: bool = False,
+    ) -> list[Transcript | Exception]:
+        """Extract transcripts for many videos with bounded concurrency.
+
+        At most max_concurrency videos are fetched at the same time over the
+        shared connection pool. A failing video does not cancel the others;
+        its exception is returned in place of the transcript.
+
+        Args:
+            videos: Video IDs or URLs.
+            language_codes: Language code(s) in priority order. Defaults to English ("en").
+            max_concurrency: Maximum number of videos fetched concurrently.
+            output: "model" for TranscriptSnippet objects, "compact" for CompactSnippet tuples,
+                "table" for a columnar TranscriptTable.
+            caption_format: Timedtext format to download: "srv1" (default XML), "srv3" or "json3".
+            translate_to: Language code to machine-translate every transcript into.
+            words: With caption_format="srv3", return one snippet per word segment instead of per line.
+
+        Returns:
+            One transcript or exception per input, in input order.
+
+        Example:
+            >>> results = await client.get_transcripts(["dQw4w9WgXcQ", "https://youtu.be/jNQXAC9IVRw"])
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+        _check_words(caption_format, words)
+
+        language_codes = _normalize_language_codes(language_codes)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(video: str) -> Transcript | Exception:
+            async with semaphore:
+                try:
+                    return await self._get_transcript(
+                        video, language_codes, output, caption_format, translate_to, words
+                    )
+                except Exception as e:
+                    logger.debug(f"Failed to get transcript for {video}: {e!r}")
+                    return e
+
+        return await asyncio.gather(*(fetch(video) for video in videos))
+
+    async def iter_transcripts(
+        self,
+        videos: Iterable[str] | AsyncIterable[str],
+        language_codes: str | Iterable[str] = ("en",),
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        output: TranscriptOutput = "model",
+        caption_format: CaptionFormat = "srv1",
+        translate_to: str | None = None,
+        words: bool = False,
+    ) -> AsyncIterator[tuple[str, Transcript | Exception]]:
+        """Extract transcripts for many videos, yielding each one as it completes.
+
+        Inputs are pulled lazily from videos, so memory stays bounded by
+        max_concurrency rather than by the number of inputs. Results are
+        yielded in completion order; a failing video yields its exception.
+
+        Args:
+            videos: Video IDs or URLs, as a sync or async iterable.
+            language_codes: Language code(s) in priority order. Defaults to English ("en").
+            max_concurrency: Maximum number of videos fetched concurrently.
+            output: "model" for TranscriptSnippet objects, "compact" for CompactSnippet tuples,
+                "table" for a columnar TranscriptTable.
+            caption_format: Timedtext format to download: "srv1" (default XML), "srv3" or "json3".
+            translate_to: Language code to machine-translate every transcript into.
+            words: With caption_format="srv3", return one snippet per word segment instead of per line.
+
+        Yields:
+            Tuples of (input video ID or URL, transcript or exception).
+
+        Example:
+            >>> async for video_id, result in client.iter_transcripts(video_ids, max_concurrency=20):
+            ...     if not isinstance(result, Exception):
+            ...         store(video_id, result)
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+        _check_words(caption_format, words)
+
+        language_codes = _normalize_language_codes(language_codes)
+        results = self._iter_bounded(
+            videos,
+            lambda video: self._get_transcript(video, language_codes, output, caption_format, translate_to, words),
+            max_concurrency,
+        )
+        async with aclosing(results):
+            async for item in results:
+                yield item
+
+    async def list_caption_tracks(self, video: str) -> Captions:
+        """List the caption tracks and translation languages of a video without fetching any transcript.
+
+        No caption track is downloaded, only the watch page (read up to the
+        end of ytInitialPlayerResponse when stream_watch_page is set) or the
+        InnerTube player response when caption_source is "innertube".
+        The captions and negative caches apply as for get_captions().
+
+        Args:
+            video: YouTube video ID or URL.
+
+        Returns:
+            Captions with caption_tracks and translation_languages.
+
+        Raises:
+            VideoIDError: If the URL contains an invalid video ID.
+            InitialPlayerResponseNotFoundError: If ytInitialPlayerResponse variable not found.
+            CaptionsNotFoundError: If the video has no captions.
+            httpx.HTTPError: If the request fails.
+
+        Example:
+            >>> captions = await client.list_caption_tracks("dQw4w9WgXcQ")
+            >>> [track.language_code for track in captions.caption_tracks]
+        """
+        video_id = parse_video_id(video) if "/" in video else video
+        return await self.get_captions(video_id)
+
+    async def iter_caption_tracks(
+        self,
+        videos: Iterable[str] | AsyncIterable[str],
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> AsyncIterator[tuple[str, Captions | Exception]]:
+        """List the caption tracks of many videos, yielding each result as it completes.
+
+        Inputs are pulled lazily, so memory stays bounded by max_concurrency.
+        A failing video yields its exception; videos without captions yield
+        CaptionsNotFoundError.
+
+        Args:
+            videos: Video IDs or URLs, as a sync or async iterable.
+            max_concurrency: Maximum number of watch pages fetched concurrently.
+
+        Yields:
+            Tuples of (input video ID or URL, Captions or exception).
+
+        Example:
+            >>> async for video_id, captions in client.iter_caption_tracks(video_ids, max_concurrency=20):
+            ...     if not isinstance(captions, Exception) and captions.caption_tracks:
+            ...         schedule(video_id)
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+
+        results = self._iter_bounded(videos, self.list_caption_tracks, max_concurrency)
+        async with aclosing(results):
+            async for item in results:
+                yield item
+
+    async def _iter_bounded[R](
+        self,
+        videos: Iterable[str] | AsyncIterable[str],
+        fetch: Callable[[str], Awaitable[R]],
+        max_concurrency: int,
+    ) -> AsyncIterator[tuple[str, R | Exception]]:
+        iterator = _aiter(videos)
+        pending: dict[asyncio.Task[R], str] = {}
+        exhausted = False
+
+        try:
+            while True:
+                while not exhausted and len(pending) < max_concurrency:
+                    try:
+                        video = await anext(iterator)
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+                    pending[asyncio.ensure_future(fetch(video))] = video
+
+                if not pending:
+                    return
+
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    video = pending.pop(task)
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        logger.debug(f"Failed to fetch {video}: {e!r}")
+                        yield video, e
+                    else:
+                        yield video, result
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _get_transcript(
+        self,
+        video: str,
+        language_codes: tuple[str, ...],
+        output: TranscriptOutput,
+        caption_format: CaptionFormat,
+        translate_to: str | None,
+        words: bool,
+    ) -> Transcript:
+        video_id = parse_video_id(video) if "/" in video else video
+        return await self.get_transcript_from_video_id(
+            video_id,
+            language_codes,
+            output=output,
+            caption_format=caption_format,
+            translate_to=translate_to,
+            words=words,
+        )
+
+
+_default_clients: WeakKeyDictionary[asyncio.AbstractEventLoop, TranscriptClient] = WeakKeyDictionary()
+
+
+def get_default_client() -> TranscriptClient:
+    """Return the shared TranscriptClient for the running event loop.
 
+    The client is created lazily on first use and reused by the module-level
+    functions, so they share one connection pool per event loop. Close it
+    with aclose_default_client().
 
+    Returns:
+        The default TranscriptClient.
+    """
+    loop = asyncio.get_running_loop()
+    client = _default_clients.get(loop)
+    if client is None:
+        client = TranscriptClient()
+        _default_clients[loop] = client
+    return client
+
+
+async def aclose_default_client() -> None:
+    """Close the default TranscriptClient of the running event loop, if one was created.
+
+    The default client holds pooled connections that are otherwise only
+    released when the loop is garbage collected. Await this before the loop
+    shuts down, e.g. at the end of the coroutine passed to asyncio.run().
+    A later module-level call creates a fresh client.
+    """
+    client = _default_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+@overload
 async def get_transcript_from_video_id(
-    video_id: str, language_codes: str | Iterable[str] = ("en",)
-) -> list[TranscriptSnippet]:
+    video_id: str,
+    language_codes: str | Iterable[str] = ...,
+    output: Literal["model"] = ...,
+    *,
+    caption_format: CaptionFormat = ...,
+    translate_to: str | None = ...,
+    words: bool = ...,
+) -> list[TranscriptSnippet]: ...
+
+
+@overload
+async def get_transcript_from_video_id(
+    video_id: str,
+    language_codes: str | Iterable[str] = ...,
+    *,
+    output: Literal["compact"],
+    caption_format: CaptionFormat = ...,
+    translate_to: str | None = ...,
+    words: bool = ...,
+) -> list[CompactSnippet]: ...
+
+
+@overload
+async def get_transcript_from_video_id(
+    video_id: str,
+    language_codes: str | Iterable[str] = ...,
+    *,
+    output: Literal["table"],
+    caption_format: CaptionFormat = ...,
+    translate_to: str | None = ...,
+    words: bool = ...,
+) -> TranscriptTable: ...
+
+
+async def get_transcript_from_video_id(
+    video_id: str,
+    language_codes: str | Iterable[str] = ("en",),
+    output: TranscriptOutput = "model",
+    *,
+    caption_format: CaptionFormat = "srv1",
+    translate_to: str | None = None,
+    words: bool = False,
+) -> Transcript:
     """Extract transcript from a YouTube video by video ID.
 
     Fetches the video page, extracts caption data, selects the appropriate
-    language track, and returns the parsed transcript.
+    language track, and returns the parsed transcript. Uses the default
+    TranscriptClient for the running event loop.
 
     Args:
         video_id: YouTube video ID (11 characters).
         language_codes: Language code(s) in priority order. Defaults to English ("en").
             Can be a single string or iterable of strings.
+        output: "model" for TranscriptSnippet objects, "compact" for CompactSnippet tuples,
+            "table" for a columnar TranscriptTable.
+        caption_format: Timedtext format to download: "srv1" (default XML), "srv3" or "json3".
+        translate_to: Language code to machine-translate the selected track into, using the
+            track's own base_url. Ignored when the selected track is already in that language.
+        words: With caption_format="srv3", return one snippet per word segment instead of per line.
 
     Returns:
         List of transcript snippets with text and timing information.
@@ -216,21 +1641,56 @@ async def get_transcript_from_video_id(
         >>> transcript = await get_transcript_from_video_id("dQw4w9WgXcQ")
         >>> transcript = await get_transcript_from_video_id("dQw4w9WgXcQ", ["zh-TW", "en"])
     """
-    video_html = await fetch_video_html(video_id)
-
-    captions = parse_captions(video_html)
-
-    caption_track = get_caption_track(captions.caption_tracks, language_codes)
-
-    base_url = caption_track.base_url
-    if base_url is None:
-        raise CaptionsNotFoundError()
-
-    xml = await fetch_html(base_url)
-    return parse_transcript(xml)
-
-
-async def get_transcript_from_url(url: str, language_codes: str | Iterable[str] = ("en",)) -> list[TranscriptSnippet]:
+    return await get_default_client().get_transcript_from_video_id(
+        video_id, language_codes, output=output, caption_format=caption_format, translate_to=translate_to, words=words
+    )
+
+
+@overload
+async def get_transcript_from_url(
+    url: str,
+    language_codes: str | Iterable[str] = ...,
+    output: Literal["model"] = ...,
+    *,
+    caption_format: CaptionFormat = ...,
+    translate_to: str | None = ...,
+    words: bool = ...,
+) -> list[TranscriptSnippet]: ...
+
+
+@overload
+async def get_transcript_from_url(
+    url: str,
+    language_codes: str | Iterable[str] = ...,
+    *,
+    output: Literal["compact"],
+    caption_format: CaptionFormat = ...,
+    translate_to: str | None = ...,
+    words: bool = ...,
+) -> list[CompactSnippet]: ...
+
+
+@overload
+async def get_transcript_from_url(
+    url: str,
+    language_codes: str | Iterable[str] = ...,
+    *,
+    output: Literal["table"],
+    caption_format: CaptionFormat = ...,
+    translate_to: str | None = ...,
+    words: bool = ...,
+) -> TranscriptTable: ...
+
+
+async def get_transcript_from_url(
+    url: str,
+    language_codes: str | Iterable[str] = ("en",),
+    output: TranscriptOutput = "model",
+    *,
+    caption_format: CaptionFormat = "srv1",
+    translate_to: str | None = None,
+    words: bool = False,
+) -> Transcript:
     """Extract transcript from a YouTube video by URL.
 
     Parses the video ID from the URL and fetches the transcript.
@@ -240,6 +1700,12 @@ async def get_transcript_from_url(url: str, language_codes: str | Iterable[str]
         url: YouTube video URL.
         language_codes: Language code(s) in priority order. Defaults to English ("en").
             Can be a single string or iterable of strings.
+        output: "model" for TranscriptSnippet objects, "compact" for CompactSnippet tuples,
+            "table" for a columnar TranscriptTable.
+        caption_format: Timedtext format to download: "srv1" (default XML), "srv3" or "json3".
+        translate_to: Language code to machine-translate the selected track into, using the
+            track's own base_url. Ignored when the selected track is already in that language.
+        words: With caption_format="srv3", return one snippet per word segment instead of per line.
 
     Returns:
         List of transcript snippets with text and timing information.
@@ -258,4 +1724,197 @@ async def get_transcript_from_url(url: str, language_codes: str | Iterable[str]
         >>> transcript = await get_transcript_from_url(url, ["zh-TW", "en"])
     """
     video_id = parse_video_id(url)
-    return await get_transcript_from_video_id(video_id, language_codes)
+    return await get_transcript_from_video_id(
+        video_id, language_codes, output=output, caption_format=caption_format, translate_to=translate_to, words=words
+    )
+
+
+async def get_transcripts_by_language(
+    video_id: str,
+    language_codes: str | Iterable[str] | None = None,
+    *,
+    output: TranscriptOutput = "model",
+    caption_format: CaptionFormat = "srv1",
+    words: bool = False,
+) -> dict[str, Transcript]:
+    """Extract several caption tracks of one video from a single watch page fetch.
+
+    Uses the default TranscriptClient for the running event loop. Languages the
+    video has no track for are left out of the result.
+
+    Args:
+        video_id: YouTube video ID (11 characters).
+        language_codes: Language code(s) to fetch, or None for all tracks.
+        output: "model" for TranscriptSnippet objects, "compact" for CompactSnippet tuples,
+            "table" for a columnar TranscriptTable.
+        caption_format: Timedtext format to download: "srv1" (default XML), "srv3" or "json3".
+        words: With caption_format="srv3", return one snippet per word segment instead of per line.
+
+    Returns:
+        Transcripts keyed by language code, or by vss_id when language_codes is None.
+
+    Example:
+        >>> transcripts = await get_transcripts_by_language("dQw4w9WgXcQ", ["ja", "en"])
+    """
+    return await get_default_client().get_transcripts_by_language(
+        video_id, language_codes, output=output, caption_format=caption_format, words=words
+    )
+
+
+async def get_transcripts(
+    videos: Iterable[str],
+    language_codes: str | Iterable[str] = ("en",),
+    *,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    output: TranscriptOutput = "model",
+    caption_format: CaptionFormat = "srv1",
+    translate_to: str | None = None,
+    words: bool = False,
+) -> list[Transcript | Exception]:
+    """Extract transcripts for many videos with bounded concurrency.
+
+    Uses the default TranscriptClient for the running event loop. Failures are
+    returned in place of the transcript instead of cancelling the batch.
+
+    Args:
+        videos: Video IDs or URLs.
+        language_codes: Language code(s) in priority order. Defaults to English ("en").
+        max_concurrency: Maximum number of videos fetched concurrently.
+        output: "model" for TranscriptSnippet objects, "compact" for CompactSnippet tuples,
+            "table" for a columnar TranscriptTable.
+        caption_format: Timedtext format to download: "srv1" (default XML), "srv3" or "json3".
+        translate_to: Language code to machine-translate every transcript into.
+        words: With caption_format="srv3", return one snippet per word segment instead of per line.
+
+    Returns:
+        One transcript or exception per input, in input order.
+
+    Example:
+        >>> results = await get_transcripts(["dQw4w9WgXcQ", "jNQXAC9IVRw"], max_concurrency=5)
+        >>> transcripts = [r for r in results if not isinstance(r, Exception)]
+    """
+    return await get_default_client().get_transcripts(
+        videos,
+        language_codes,
+        max_concurrency=max_concurrency,
+        output=output,
+        caption_format=caption_format,
+        translate_to=translate_to,
+        words=words,
+    )
+
+
+async def iter_transcripts(
+    videos: Iterable[str] | AsyncIterable[str],
+    language_codes: str | Iterable[str] = ("en",),
+    *,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    output: TranscriptOutput = "model",
+    caption_format: CaptionFormat = "srv1",
+    translate_to: str | None = None,
+    words: bool = False,
+) -> AsyncIterator[tuple[str, Transcript | Exception]]:
+    """Extract transcripts for many videos, yielding each one as it completes.
+
+    Uses the default TranscriptClient for the running event loop. Inputs are
+    pulled lazily, so memory stays bounded by max_concurrency.
+
+    Args:
+        videos: Video IDs or URLs, as a sync or async iterable.
+        language_codes: Language code(s) in priority order. Defaults to English ("en").
+        max_concurrency: Maximum number of videos fetched concurrently.
+        output: "model" for TranscriptSnippet objects, "compact" for CompactSnippet tuples,
+            "table" for a columnar TranscriptTable.
+        caption_format: Timedtext format to download: "srv1" (default XML), "srv3" or "json3".
+        translate_to: Language code to machine-translate every transcript into.
+        words: With caption_format="srv3", return one snippet per word segment instead of per line.
+
+    Yields:
+        Tuples of (input video ID or URL, transcript or exception).
+
+    Example:
+        >>> async for video_id, result in iter_transcripts(video_ids, max_concurrency=20):
+        ...     print(video_id, result)
+    """
+    async for item in get_default_client().iter_transcripts(
+        videos,
+        language_codes,
+        max_concurrency=max_concurrency,
+        output=output,
+        caption_format=caption_format,
+        translate_to=translate_to,
+        words=words,
+    ):
+        yield item
+
+
+async def list_caption_tracks(video: str) -> Captions:
+    """List the caption tracks and translation languages of a video without fetching any transcript.
+
+    Delegates to the default TranscriptClient for the running event loop.
+
+    Args:
+        video: YouTube video ID or URL.
+
+    Returns:
+        Captions with caption_tracks and translation_languages.
+
+    Raises:
+        VideoIDError: If the URL contains an invalid video ID.
+        InitialPlayerResponseNotFoundError: If ytInitialPlayerResponse variable not found.
+        CaptionsNotFoundError: If the video has no captions.
+        httpx.HTTPError: If the request fails.
+
+    Example:
+        >>> captions = await list_caption_tracks("dQw4w9WgXcQ")
+        >>> languages = {track.language_code for track in captions.caption_tracks}
+    """
+    return await get_default_client().list_caption_tracks(video)
+
+
+async def iter_caption_tracks(
+    videos: Iterable[str] | AsyncIterable[str],
+    *,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> AsyncIterator[tuple[str, Captions | Exception]]:
+    """List the caption tracks of many videos, yielding each result as it completes.
+
+    Uses the default TranscriptClient for the running event loop. Inputs are
+    pulled lazily, so memory stays bounded by max_concurrency.
+
+    Args:
+        videos: Video IDs or URLs, as a sync or async iterable.
+        max_concurrency: Maximum number of watch pages fetched concurrently.
+
+    Yields:
+        Tuples of (input video ID or URL, Captions or exception).
+
+    Example:
+        >>> async for video_id, captions in iter_caption_tracks(video_ids, max_concurrency=20):
+        ...     print(video_id, captions)
+    """
+    async for item in get_default_client().iter_caption_tracks(videos, max_concurrency=max_concurrency):
+        yield item
+
+
+async def stream_transcript(
+    video_id: str, language_codes: str | Iterable[str] = ("en",)
+) -> AsyncIterator[CompactSnippet]:
+    """Stream a transcript, yielding snippets while the caption track downloads.
+
+    Uses the default TranscriptClient for the running event loop. Memory stays
+    constant regardless of the length of the caption track.
+
+    Args:
+        video_id: YouTube video ID (11 characters).
+        language_codes: Language code(s) in priority order. Defaults to English ("en").
+
+    Yields:
+        Transcript snippets in document order.
+
+    Example:
+        >>> async for snippet in stream_transcript("dQw4w9WgXcQ"):
+        ...     print(snippet.start, snippet.text)
+    """
+    async for snippet in get_default_client().stream_transcript(video_id, language_codes):
+        yield snippet
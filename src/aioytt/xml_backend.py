@@ -0,0 +1,89 @@
+"""XML parsing backend used for caption tracks.
+
+lxml is used automatically when it is installed, falling back to the standard
+library xml.etree.ElementTree. Set the AIOYTT_XML_BACKEND environment variable
+or call set_xml_backend() to choose one explicitly.
+
+Both backends return trees without comments or processing instructions, so
+iterating over an element only yields child elements, as with ElementTree.
+"""
+
+from __future__ import annotations
+
+import importlib
+import os
+from collections.abc import Callable
+from typing import Any
+from typing import Final
+from xml.etree import ElementTree
+
+XML_BACKENDS: Final[tuple[str, ...]] = ("lxml", "etree")
+
+_backend: str = "etree"
+_fromstring: Callable[[str | bytes], Any] = ElementTree.fromstring
+
+
+def _load_backend(name: str) -> Callable[[str | bytes], Any]:
+    if name == "lxml":
+        etree = importlib.import_module("lxml.etree")
+        parser = etree.XMLParser(
+            remove_comments=True, remove_pis=True, resolve_entities=False, no_network=True, huge_tree=True
+        )
+
+        def fromstring(data: str | bytes) -> Any:
+            # lxml rejects str input that carries an encoding declaration, which caption XML always has.
+            if isinstance(data, str):
+                data = data.encode()
+            return etree.fromstring(data, parser)
+
+        return fromstring
+    if name == "etree":
+        return ElementTree.fromstring
+    raise ValueError(f"unknown XML backend: {name}, expected one of {', '.join(XML_BACKENDS)}")
+
+
+def set_xml_backend(name: str | None = None) -> str:
+    """Select the XML backend.
+
+    Args:
+        name: One of "lxml" or "etree". None picks lxml when it is installed.
+
+    Returns:
+        The name of the selected backend.
+
+    Raises:
+        ValueError: If name is not a known backend.
+        ImportError: If the requested backend is not installed.
+    """
+    global _backend, _fromstring
+
+    if name is None:
+        for candidate in XML_BACKENDS:
+            try:
+                _fromstring = _load_backend(candidate)
+            except ImportError:
+                continue
+            _backend = candidate
+            break
+        return _backend
+
+    _fromstring = _load_backend(name)
+    _backend = name
+    return _backend
+
+
+def get_xml_backend() -> str:
+    """Return the name of the XML backend in use."""
+    return _backend
+
+
+def fromstring(data: str | bytes) -> Any:
+    """Parse an XML document with the selected backend and return its root element.
+
+    Raises:
+        SyntaxError: If data is not well-formed XML. Both backends raise a subclass of SyntaxError.
+    """
+    return _fromstring(data)
+
+
+set_xml_backend(os.getenv("AIOYTT_XML_BACKEND") or None)
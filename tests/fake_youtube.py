@@ -0,0 +1,73 @@
+"""Fake YouTube transport shared by the TranscriptClient tests.
+
+The watch page lists the given caption tracks in its player response, and
+every other URL is answered as a caption track. By default each caption
+track is a one-line transcript naming what was requested, so tests can tell
+which track, kind and translation were fetched.
+"""
+
+import json
+from collections.abc import Callable
+from collections.abc import Iterable
+from typing import Final
+
+import httpx
+
+TIMEDTEXT_URL: Final[str] = "https://www.youtube.com/api/timedtext"
+
+
+def caption_track(
+    language_code: str,
+    *,
+    kind: str | None = None,
+    vss_id: str | None = None,
+    is_translatable: bool | None = None,
+) -> dict:
+    """Return player response JSON for a caption track served by youtube_transport()."""
+    track: dict = {"baseUrl": f"{TIMEDTEXT_URL}?lang={language_code}", "languageCode": language_code}
+    if kind is not None:
+        track["baseUrl"] += f"&kind={kind}"
+        track["kind"] = kind
+    if vss_id is not None:
+        track["vssId"] = vss_id
+    if is_translatable is not None:
+        track["isTranslatable"] = is_translatable
+    return track
+
+
+def echo_caption(request: httpx.Request) -> httpx.Response:
+    """Answer a caption request with one line naming its tlang, or else its lang and kind."""
+    params = request.url.params
+    text = params.get("tlang", params.get("lang", "") + params.get("kind", ""))
+    return httpx.Response(200, text=f'<transcript><text start="0" dur="1">{text}</text></transcript>')
+
+
+def youtube_transport(
+    caption_tracks: list[dict],
+    requests: list[httpx.URL] | None = None,
+    *,
+    translation_languages: Iterable[str] = (),
+    caption_response: Callable[[httpx.Request], httpx.Response] = echo_caption,
+) -> httpx.MockTransport:
+    """Return a transport serving a watch page with caption_tracks, and caption tracks for any other URL.
+
+    Args:
+        caption_tracks: Player response JSON of the tracks, e.g. from caption_track().
+        requests: Optional list that every request URL is appended to, in order.
+        translation_languages: Language codes listed as translation targets.
+        caption_response: Builds the response to a caption request.
+    """
+    renderer: dict = {"captionTracks": caption_tracks}
+    if translation_languages:
+        renderer["translationLanguages"] = [{"languageCode": code} for code in translation_languages]
+    player_response = {"playabilityStatus": {"status": "OK"}, "captions": {"playerCaptionsTracklistRenderer": renderer}}
+    html = f"<script>var ytInitialPlayerResponse = {json.dumps(player_response)};</script>"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if requests is not None:
+            requests.append(request.url)
+        if request.url.path == "/watch":
+            return httpx.Response(200, text=html)
+        return caption_response(request)
+
+    return httpx.MockTransport(handler)
@@ -0,0 +1,59 @@
+import time
+
+import pytest
+
+from aioytt.cache import TTLCache
+
+
+def test_ttl_cache_returns_stored_value():
+    """Test that a stored value is returned until it expires."""
+
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get("missing") is None
+
+
+def test_ttl_cache_expires_entries():
+    """Test that entries are dropped once their ttl has passed."""
+
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1, ttl=0.01)
+    time.sleep(0.02)
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_skips_non_positive_ttl():
+    """Test that a non-positive per-entry ttl does not store the value."""
+
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1, ttl=0)
+
+    assert cache.get("a") is None
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    """Test that the least recently used entry is evicted when the cache is full."""
+
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_rejects_invalid_arguments():
+    """Test that TTLCache validates maxsize and ttl."""
+
+    with pytest.raises(ValueError):
+        TTLCache(maxsize=0)
+
+    with pytest.raises(ValueError):
+        TTLCache(ttl=0)
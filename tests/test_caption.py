@@ -0,0 +1,77 @@
+from aioytt.caption import Captions
+from aioytt.caption import CaptionsData
+from aioytt.caption import CaptionTrack
+from aioytt.caption import CaptionTrackData
+from aioytt.transcript import parse_captions
+from aioytt.transcript import parse_captions_data
+
+CAPTIONS_JSON = {
+    "captionTracks": [
+        {
+            "baseUrl": "https://www.youtube.com/api/timedtext?v=dQw4w9WgXcQ&lang=en",
+            "name": {"simpleText": "English"},
+            "vssId": ".en",
+            "languageCode": "en",
+            "isTranslatable": True,
+            "trackName": "",
+        },
+        {
+            "baseUrl": "https://www.youtube.com/api/timedtext?v=dQw4w9WgXcQ&lang=ja&kind=asr",
+            "vssId": "a.ja",
+            "languageCode": "ja",
+            "kind": "asr",
+        },
+    ],
+    "audioTracks": [{"captionTrackIndices": [0, 1], "audioTrackId": "und"}],
+    "defaultAudioTrackIndex": 0,
+    "translationLanguages": [
+        {"languageCode": "fr", "languageName": {"simpleText": "French"}},
+        {"languageCode": "de", "languageName": {"simpleText": "German"}},
+    ],
+}
+
+
+def test_caption_track_data_from_json():
+    """Test that CaptionTrackData unpacks the caption track fields."""
+
+    track = CaptionTrackData.from_json(CAPTIONS_JSON["captionTracks"][0])
+
+    assert track.base_url == "https://www.youtube.com/api/timedtext?v=dQw4w9WgXcQ&lang=en"
+    assert track.name == "English"
+    assert track.vss_id == ".en"
+    assert track.language_code == "en"
+    assert track.kind is None
+    assert track.is_translatable is True
+    assert track.to_model() == CaptionTrack.model_validate(CAPTIONS_JSON["captionTracks"][0])
+
+
+def test_captions_data_to_model_matches_validation():
+    """Test that CaptionsData converts to the same Captions model as validation."""
+
+    captions = CaptionsData.from_json(CAPTIONS_JSON)
+
+    assert [track.language_code for track in captions.caption_tracks] == ["en", "ja"]
+    assert captions.to_model() == Captions.model_validate(CAPTIONS_JSON)
+
+
+def test_parse_captions_data_matches_parse_captions():
+    """Test that the unvalidated parser finds the same caption tracks."""
+
+    html = """
+    var ytInitialPlayerResponse = {"captions": {"playerCaptionsTracklistRenderer": {"captionTracks": [
+        {"baseUrl": "https://example.com/captions", "languageCode": "en", "kind": "asr"}
+    ]}}};</script>
+    """
+
+    assert parse_captions_data(html).to_model() == parse_captions(html)
+
+
+def test_captions_translation_languages():
+    """Test that translation languages are exposed on Captions and as codes on CaptionsData."""
+
+    captions = Captions.model_validate(CAPTIONS_JSON)
+    captions_data = CaptionsData.from_json(CAPTIONS_JSON)
+
+    assert [language.language_code for language in captions.translation_languages] == ["fr", "de"]
+    assert captions.translation_languages[0].language_name.simple_text == "French"
+    assert captions_data.translation_language_codes == ["fr", "de"]
@@ -0,0 +1,85 @@
+import importlib.util
+from unittest.mock import patch
+
+import pytest
+
+from aioytt.errors import CaptionsNotFoundError
+from aioytt.json_backend import JSON_BACKENDS
+from aioytt.json_backend import get_json_backend
+from aioytt.json_backend import loads
+from aioytt.json_backend import set_json_backend
+from aioytt.transcript import _JSON_DECODER
+from aioytt.transcript import parse_captions
+
+AVAILABLE_BACKENDS = [
+    backend for backend in JSON_BACKENDS if backend == "json" or importlib.util.find_spec(backend) is not None
+]
+
+HTML = (
+    '<script>var ytInitialPlayerResponse = {"streamingData": {"formats": []}, "captions": '
+    '{"other": 1, "playerCaptionsTracklistRenderer": {"captionTracks": [{"languageCode": "en"}]}}}'
+    ';var head = document.getElementsByTagName("head")[0];</script>'
+)
+
+
+@pytest.fixture(autouse=True)
+def restore_backend():
+    backend = get_json_backend()
+    yield
+    set_json_backend(backend)
+
+
+def test_set_json_backend_auto_detects_installed_backend():
+    """Test that automatic selection picks the first installed backend."""
+
+    assert set_json_backend() == AVAILABLE_BACKENDS[0]
+    assert get_json_backend() == AVAILABLE_BACKENDS[0]
+
+
+def test_set_json_backend_rejects_unknown_backend():
+    """Test that an unknown backend name raises ValueError."""
+
+    with pytest.raises(ValueError):
+        set_json_backend("simplejson")
+
+
+@pytest.mark.parametrize("backend", AVAILABLE_BACKENDS)
+def test_loads_matches_stdlib(backend):
+    """Test that every backend decodes documents like the json module."""
+
+    set_json_backend(backend)
+
+    assert loads('{"a": [1, 2.5, "\\u00e9"], "b": null}') == {"a": [1, 2.5, "é"], "b": None}
+    with pytest.raises(ValueError):
+        loads("{not json}")
+
+
+@pytest.mark.parametrize("backend", AVAILABLE_BACKENDS)
+def test_parse_captions_with_backend(backend):
+    """Test that parse_captions gives the same result with every backend."""
+
+    set_json_backend(backend)
+
+    captions = parse_captions(HTML)
+    assert captions.caption_tracks[0].language_code == "en"
+
+
+@pytest.mark.parametrize("backend", [backend for backend in AVAILABLE_BACKENDS if backend != "json"])
+def test_fast_backend_decodes_player_response_once(backend):
+    """Test that a player response followed by other statements is decoded once, without the json fallback."""
+
+    set_json_backend(backend)
+    html = (
+        '<script>var ytInitialPlayerResponse = {"playabilityStatus": {"status": "OK"}, "videoDetails": {}}'
+        ";var meta = document.createElement('meta');var head = document.head;</script>"
+    )
+
+    with (
+        patch("aioytt.transcript.json_loads", wraps=loads) as mock_loads,
+        patch.object(_JSON_DECODER, "raw_decode", wraps=_JSON_DECODER.raw_decode) as mock_raw_decode,
+        pytest.raises(CaptionsNotFoundError),
+    ):
+        parse_captions(html)
+
+    mock_loads.assert_called_once()
+    mock_raw_decode.assert_not_called()
@@ -0,0 +1,218 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from aioytt.ratelimit import AdaptiveRateLimiter
+from aioytt.ratelimit import RateLimiter
+from aioytt.ratelimit import TokenBucket
+from aioytt.ratelimit import TokenBucketRateLimiter
+from aioytt.ratelimit import parse_retry_after
+from aioytt.transcript import TranscriptClient
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_allows_burst_without_waiting():
+    """Test that a full bucket serves burst requests immediately."""
+
+    bucket = TokenBucket(rate=1, burst=5)
+
+    started = time.monotonic()
+    for _ in range(5):
+        await bucket.acquire()
+
+    assert time.monotonic() - started < 0.05
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_waits_for_refill():
+    """Test that requests beyond the burst are spaced by the refill rate."""
+
+    bucket = TokenBucket(rate=50, burst=1)
+
+    started = time.monotonic()
+    await asyncio.gather(*(bucket.acquire() for _ in range(4)))
+
+    assert time.monotonic() - started >= 0.05
+
+
+def test_token_bucket_rejects_invalid_arguments():
+    """Test that TokenBucket validates rate and burst."""
+
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+    with pytest.raises(ValueError):
+        TokenBucket(rate=1, burst=0)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_rate_limiter_keeps_hosts_independent():
+    """Test that each host has its own budget."""
+
+    limiter = TokenBucketRateLimiter(rate=1, burst=1)
+
+    started = time.monotonic()
+    await limiter.acquire("www.youtube.com")
+    await limiter.acquire("example.com")
+
+    assert time.monotonic() - started < 0.05
+
+
+@pytest.mark.asyncio
+async def test_transcript_client_acquires_rate_limiter_per_request():
+    """Test that TranscriptClient waits on the rate limiter with the request host."""
+
+    class RecordingRateLimiter(RateLimiter):
+        def __init__(self) -> None:
+            self.hosts: list[str] = []
+
+        async def acquire(self, host: str) -> None:
+            self.hosts.append(host)
+
+    limiter = RecordingRateLimiter()
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, text="ok"))
+
+    async with httpx.AsyncClient(transport=transport) as http_client:
+        client = TranscriptClient(http_client=http_client, rate_limiter=limiter)
+        await client.fetch_html("https://www.youtube.com/watch?", params={"v": "dQw4w9WgXcQ"})
+        await client.fetch_html("https://example.com/captions")
+
+    assert limiter.hosts == ["www.youtube.com", "example.com"]
+
+
+@pytest.mark.asyncio
+async def test_transcript_client_reports_throttles_with_send_time():
+    """Test that TranscriptClient passes the time a throttled request was sent to on_throttle."""
+
+    class RecordingRateLimiter(RateLimiter):
+        def __init__(self) -> None:
+            self.sent_at: list[float | None] = []
+
+        async def acquire(self, host: str) -> None:
+            pass
+
+        def on_throttle(self, host: str, retry_after: float | None, *, sent_at: float | None = None) -> None:
+            self.sent_at.append(sent_at)
+
+    limiter = RecordingRateLimiter()
+    responses = [httpx.Response(429, headers={"Retry-After": "0"}), httpx.Response(200, text="ok")]
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(lambda request: responses.pop(0))) as http_client:
+        client = TranscriptClient(http_client=http_client, rate_limiter=limiter)
+        started = time.monotonic()
+        await client.fetch_html("https://example.com/captions")
+
+    assert len(limiter.sent_at) == 1
+    assert limiter.sent_at[0] is not None
+    assert started <= limiter.sent_at[0] <= time.monotonic()
+
+
+def test_rate_limiter_requires_acquire():
+    """Test that a RateLimiter subclass without acquire() cannot be instantiated."""
+
+    class IncompleteRateLimiter(RateLimiter):
+        pass
+
+    limiter_class: type[RateLimiter] = IncompleteRateLimiter
+    with pytest.raises(TypeError):
+        limiter_class()
+
+
+def test_parse_retry_after():
+    """Test parse_retry_after handles seconds, HTTP dates and invalid values."""
+
+    assert parse_retry_after("120") == 120.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_adaptive_rate_limiter_decreases_and_recovers():
+    """Test that throttling halves the host rate and successes raise it back to max_rate."""
+
+    limiter = AdaptiveRateLimiter(rate=4, burst=1, min_rate=1, increase=1)
+
+    limiter.on_throttle("www.youtube.com", None)
+    assert limiter._bucket("www.youtube.com").rate == 2
+
+    limiter.on_throttle("www.youtube.com", None)
+    limiter.on_throttle("www.youtube.com", None)
+    assert limiter._bucket("www.youtube.com").rate == 1
+
+    for _ in range(10):
+        limiter.on_success("www.youtube.com")
+    assert limiter._bucket("www.youtube.com").rate == 4
+    assert limiter._bucket("example.com").rate == 4
+
+
+def test_adaptive_rate_limiter_decreases_once_per_burst_of_throttles(monkeypatch):
+    """Test that late 429s for requests sent before a decrease do not lower the rate again."""
+
+    clock = [100.0]
+    monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+    limiter = AdaptiveRateLimiter(rate=20, burst=10)
+
+    # Ten requests sent together, throttled with responses spread over 300 ms, far longer than 1/rate.
+    sent_at = clock[0]
+    for _ in range(10):
+        clock[0] += 0.03
+        limiter.on_throttle("www.youtube.com", None, sent_at=sent_at)
+    assert limiter._bucket("www.youtube.com").rate == 10
+
+    # A request sent after the decrease and throttled again lowers it once more.
+    sent_at = clock[0]
+    clock[0] += 0.03
+    limiter.on_throttle("www.youtube.com", None, sent_at=sent_at)
+    assert limiter._bucket("www.youtube.com").rate == 5
+
+
+@pytest.mark.asyncio
+async def test_adaptive_rate_limiter_honours_retry_after():
+    """Test that a Retry-After delay blocks the host until it expires."""
+
+    limiter = AdaptiveRateLimiter(rate=1000, burst=10)
+    limiter.on_throttle("www.youtube.com", 0.05)
+
+    started = time.monotonic()
+    await limiter.acquire("www.youtube.com")
+
+    assert time.monotonic() - started >= 0.05
+
+
+@pytest.mark.asyncio
+async def test_transcript_client_retries_throttled_responses():
+    """Test that 429 responses are retried after Retry-After and reported to the limiter."""
+
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(200, text="ok"),
+    ]
+    limiter = AdaptiveRateLimiter(rate=1000, burst=10)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(lambda request: responses.pop(0))) as http_client:
+        client = TranscriptClient(http_client=http_client, rate_limiter=limiter)
+        result = await client.fetch_html("https://www.youtube.com/watch?")
+
+    assert result == "ok"
+    assert limiter._bucket("www.youtube.com").rate == 500 + limiter.increase
+
+
+@pytest.mark.asyncio
+async def test_transcript_client_does_not_retry_other_status_errors():
+    """Test that non-throttling HTTP errors are raised without retrying."""
+
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(404)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+        client = TranscriptClient(http_client=http_client)
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.fetch_html("https://www.youtube.com/watch?")
+
+    assert calls == 1
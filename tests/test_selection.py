@@ -0,0 +1,105 @@
+import httpx
+import pytest
+
+from aioytt.caption import CaptionTrack
+from aioytt.caption import CaptionTrackData
+from aioytt.errors import CaptionsNotFoundError
+from aioytt.selection import CaptionTrackIndex
+from aioytt.selection import TrackSelection
+from aioytt.selection import base_language
+from aioytt.transcript import CompactSnippet
+from aioytt.transcript import TranscriptClient
+
+from .fake_youtube import youtube_transport
+
+TRACKS_JSON = [
+    {"baseUrl": "https://www.youtube.com/api/timedtext?lang=en&kind=asr", "languageCode": "en", "kind": "asr",
+     "vssId": "a.en", "isTranslatable": True},
+    {"baseUrl": "https://www.youtube.com/api/timedtext?lang=en-GB", "languageCode": "en-GB", "vssId": ".en-GB",
+     "isTranslatable": True},
+    {"baseUrl": "https://www.youtube.com/api/timedtext?lang=ja&kind=asr", "languageCode": "ja", "kind": "asr",
+     "vssId": "a.ja", "isTranslatable": True},
+]  # fmt: skip
+
+TRACKS = [CaptionTrackData.from_json(track) for track in TRACKS_JSON]
+
+
+def test_base_language():
+    """Test that the primary subtag is extracted and lowercased."""
+
+    assert base_language("en-US") == "en"
+    assert base_language("zh-Hant-TW") == "zh"
+    assert base_language("EN") == "en"
+
+
+def test_select_prefers_manual_and_matches_base_language():
+    """Test that a manual en-GB track beats an ASR en track when asking for en."""
+
+    selection = CaptionTrackIndex(TRACKS).select("en")
+
+    assert selection == TrackSelection(TRACKS[1], "manual", "en")
+
+
+def test_select_follows_policy_order():
+    """Test that the policy order decides between manual and ASR tracks."""
+
+    assert CaptionTrackIndex(TRACKS).select("en", policy=("asr", "manual")) == TrackSelection(TRACKS[0], "asr", "en")
+
+
+def test_select_follows_language_priority():
+    """Test that an ASR track in the first language beats a manual track in the second."""
+
+    assert CaptionTrackIndex(TRACKS).select(["ja", "en"]) == TrackSelection(TRACKS[2], "asr", "ja")
+
+
+def test_select_translated_from_manual_track():
+    """Test that translation starts from a manual track and respects the offered languages."""
+
+    index = CaptionTrackIndex(TRACKS, translation_language_codes=["fr", "de"])
+
+    assert index.select("fr") == TrackSelection(TRACKS[1], "translated", "fr", translate_to="fr")
+    assert index.select("ko") is None
+    assert index.select("fr", policy=("manual", "asr")) is None
+
+
+def test_select_with_caption_track_models():
+    """Test that the index also works on validated CaptionTrack models."""
+
+    tracks = [CaptionTrack.model_validate(track) for track in TRACKS_JSON]
+
+    selection = CaptionTrackIndex(tracks).select("en-US")
+
+    assert selection is not None
+    assert selection.caption_track.vss_id == ".en-GB"
+
+
+def test_select_rejects_invalid_policy():
+    """Test that unknown or empty policies raise ValueError."""
+
+    index = CaptionTrackIndex(TRACKS)
+
+    with pytest.raises(ValueError):
+        index.select("en", policy=("manual", "dubbed"))
+    with pytest.raises(ValueError):
+        index.select("en", policy=())
+    with pytest.raises(ValueError):
+        TranscriptClient(selection_policy=["best"])
+
+
+@pytest.mark.asyncio
+async def test_transcript_client_selection_policy():
+    """Test that a client with a selection policy fetches the chosen track, translating when needed."""
+
+    requested = []
+
+    async with httpx.AsyncClient(transport=youtube_transport(TRACKS_JSON, requested)) as http_client:
+        client = TranscriptClient(http_client=http_client, selection_policy=("manual", "translated"))
+        transcript = await client.get_transcript_from_video_id("dQw4w9WgXcQ", ["ja"], output="compact")
+
+        strict = TranscriptClient(http_client=http_client, selection_policy=("manual",))
+        with pytest.raises(CaptionsNotFoundError):
+            await strict.get_transcript_from_video_id("dQw4w9WgXcQ", ["ja"])
+
+    assert transcript == [CompactSnippet("ja", 0.0, 1.0)]
+    assert requested[1].params["lang"] == "en-GB"
+    assert requested[1].params["tlang"] == "ja"
@@ -0,0 +1,72 @@
+import asyncio
+
+import pytest
+
+from aioytt.singleflight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_in_flight_call():
+    """Test that concurrent calls with the same key run the function once."""
+
+    calls = 0
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    single_flight: SingleFlight[int] = SingleFlight()
+    results = await asyncio.gather(*(single_flight.do("key", work) for _ in range(5)))
+
+    assert results == [1, 1, 1, 1, 1]
+    assert len(single_flight) == 0
+
+
+@pytest.mark.asyncio
+async def test_single_flight_runs_again_after_completion():
+    """Test that a finished call is not reused by later callers."""
+
+    calls = 0
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        return calls
+
+    single_flight: SingleFlight[int] = SingleFlight()
+
+    assert await single_flight.do("key", work) == 1
+    assert await single_flight.do("key", work) == 2
+
+
+@pytest.mark.asyncio
+async def test_single_flight_propagates_errors_to_all_waiters():
+    """Test that every waiter receives the shared exception."""
+
+    async def work():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    single_flight: SingleFlight[None] = SingleFlight()
+    results = await asyncio.gather(*(single_flight.do("key", work) for _ in range(3)), return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_single_flight_survives_cancelled_waiter():
+    """Test that cancelling one waiter does not cancel the shared call."""
+
+    async def work():
+        await asyncio.sleep(0.01)
+        return "done"
+
+    single_flight: SingleFlight[str] = SingleFlight()
+    first = asyncio.create_task(single_flight.do("key", work))
+    second = asyncio.create_task(single_flight.do("key", work))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "done"
@@ -0,0 +1,188 @@
+import sqlite3
+import time
+from contextlib import closing
+from unittest.mock import AsyncMock
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from aioytt.errors import CaptionsNotFoundError
+from aioytt.sqlite_cache import SQLiteTranscriptCache
+from aioytt.transcript import CompactSnippet
+from aioytt.transcript import TranscriptClient
+
+from .fake_youtube import caption_track
+from .fake_youtube import youtube_transport
+
+TRANSCRIPT = [
+    CompactSnippet("Hello", 0.0, 1.0),
+    CompactSnippet("World", 1.0, 2.5),
+]
+
+
+def test_sqlite_cache_round_trip(tmp_path):
+    """Test that a stored transcript is read back for the same video and languages."""
+
+    cache = SQLiteTranscriptCache(tmp_path / "cache.db")
+    cache.set("dQw4w9WgXcQ", ("en",), TRANSCRIPT, vss_id=".en", language_code="en")
+
+    assert cache.get("dQw4w9WgXcQ", ("en",)) == TRANSCRIPT
+    assert cache.get("dQw4w9WgXcQ", ("fr",)) is None
+    assert len(cache) == 1
+
+
+def test_sqlite_cache_is_keyed_by_caption_format(tmp_path):
+    """Test that transcripts downloaded in different caption formats are stored separately."""
+
+    cache = SQLiteTranscriptCache(tmp_path / "cache.db")
+    cache.set("dQw4w9WgXcQ", ("en",), TRANSCRIPT, caption_format="json3")
+
+    assert cache.get("dQw4w9WgXcQ", ("en",), "json3") == TRANSCRIPT
+    assert cache.get("dQw4w9WgXcQ", ("en",)) is None
+
+
+def test_sqlite_cache_is_keyed_by_words(tmp_path):
+    """Test that srv3 transcripts split into words are stored apart from per-line ones."""
+
+    cache = SQLiteTranscriptCache(tmp_path / "cache.db")
+    cache.set("dQw4w9WgXcQ", ("en",), TRANSCRIPT, caption_format="srv3", words=True)
+
+    assert cache.get("dQw4w9WgXcQ", ("en",), "srv3", words=True) == TRANSCRIPT
+    assert cache.get("dQw4w9WgXcQ", ("en",), "srv3") is None
+
+
+def test_sqlite_cache_rebuilds_file_with_old_schema(tmp_path):
+    """Test that a cache file written with an older table layout is emptied and usable."""
+
+    path = tmp_path / "cache.db"
+    with closing(sqlite3.connect(path)) as conn, conn:
+        conn.execute(
+            "CREATE TABLE transcripts (video_id TEXT, languages TEXT, snippets TEXT, created_at REAL, accessed_at REAL)"
+        )
+        conn.execute("INSERT INTO transcripts VALUES ('dQw4w9WgXcQ', 'en', '[]', 0, 0)")
+
+    cache = SQLiteTranscriptCache(path)
+    assert len(cache) == 0
+
+    cache.set("dQw4w9WgXcQ", ("en",), TRANSCRIPT)
+    assert SQLiteTranscriptCache(path).get("dQw4w9WgXcQ", ("en",)) == TRANSCRIPT
+
+
+def test_sqlite_cache_is_shared_between_instances(tmp_path):
+    """Test that separate cache objects on the same file see each other's writes."""
+
+    SQLiteTranscriptCache(tmp_path / "cache.db").set("dQw4w9WgXcQ", ("en",), TRANSCRIPT)
+
+    assert SQLiteTranscriptCache(tmp_path / "cache.db").get("dQw4w9WgXcQ", ("en",)) == TRANSCRIPT
+
+
+def test_sqlite_cache_expires_entries(tmp_path):
+    """Test that entries older than ttl are not returned."""
+
+    cache = SQLiteTranscriptCache(tmp_path / "cache.db", ttl=0.01)
+    cache.set("dQw4w9WgXcQ", ("en",), TRANSCRIPT)
+    time.sleep(0.02)
+
+    assert cache.get("dQw4w9WgXcQ", ("en",)) is None
+
+
+def test_sqlite_cache_evicts_least_recently_read(tmp_path):
+    """Test that the least recently read entries are evicted beyond max_entries."""
+
+    cache = SQLiteTranscriptCache(tmp_path / "cache.db", max_entries=2)
+    cache.set("video000001", ("en",), TRANSCRIPT)
+    cache.set("video000002", ("en",), TRANSCRIPT)
+    cache.get("video000001", ("en",))
+    cache.set("video000003", ("en",), TRANSCRIPT)
+
+    assert len(cache) == 2
+    assert cache.get("video000001", ("en",)) == TRANSCRIPT
+    assert cache.get("video000002", ("en",)) is None
+
+
+def test_sqlite_cache_rejects_invalid_arguments(tmp_path):
+    """Test that SQLiteTranscriptCache validates ttl and max_entries."""
+
+    with pytest.raises(ValueError):
+        SQLiteTranscriptCache(tmp_path / "cache.db", ttl=0)
+
+    with pytest.raises(ValueError):
+        SQLiteTranscriptCache(tmp_path / "cache.db", max_entries=0)
+
+
+@pytest.mark.asyncio
+async def test_transcript_client_reads_transcript_cache(tmp_path):
+    """Test that a cached transcript is returned without any network request."""
+
+    cache = SQLiteTranscriptCache(tmp_path / "cache.db")
+    cache.set("dQw4w9WgXcQ", ("en",), TRANSCRIPT)
+
+    with patch.object(TranscriptClient, "fetch_html", new_callable=AsyncMock) as mock_fetch_html:
+        client = TranscriptClient(transcript_cache=cache)
+        result = await client.get_transcript_from_video_id("dQw4w9WgXcQ", "en")
+
+    assert result == [snippet.to_model() for snippet in TRANSCRIPT]
+    mock_fetch_html.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_transcript_client_writes_transcript_cache(tmp_path):
+    """Test that a fetched transcript is stored in the cache."""
+
+    cache = SQLiteTranscriptCache(tmp_path / "cache.db")
+
+    with patch.object(TranscriptClient, "_get_captions_data", new_callable=AsyncMock) as mock_get_captions:
+        mock_get_captions.return_value.caption_tracks = []
+        client = TranscriptClient(transcript_cache=cache)
+        with (
+            patch("aioytt.transcript.get_caption_track") as mock_get_caption_track,
+            patch.object(TranscriptClient, "fetch_html", new_callable=AsyncMock),
+            patch("aioytt.transcript.parse_transcript", return_value=TRANSCRIPT),
+        ):
+            mock_get_caption_track.return_value.base_url = "https://example.com/captions"
+            mock_get_caption_track.return_value.vss_id = ".en"
+            mock_get_caption_track.return_value.language_code = "en"
+            await client.get_transcript_from_video_id("dQw4w9WgXcQ", "en")
+
+    assert cache.get("dQw4w9WgXcQ", ("en",)) == TRANSCRIPT
+
+
+@pytest.mark.asyncio
+async def test_transcript_client_reads_back_untranslated_translate_to(tmp_path):
+    """Test that translate_to equal to the track's language is cached under the requested value."""
+
+    cache = SQLiteTranscriptCache(tmp_path / "cache.db")
+    requests = []
+    tracks = [caption_track("en", is_translatable=True)]
+
+    async with httpx.AsyncClient(transport=youtube_transport(tracks, requests)) as http_client:
+        client = TranscriptClient(http_client=http_client, transcript_cache=cache)
+        first = await client.get_transcript_from_video_id("dQw4w9WgXcQ", "en", output="compact", translate_to="en")
+        sent = len(requests)
+        second = await client.get_transcript_from_video_id("dQw4w9WgXcQ", "en", output="compact", translate_to="en")
+
+    assert first == second == [CompactSnippet("en", 0.0, 1.0)]
+    assert sent == 2
+    assert len(requests) == sent
+
+
+@pytest.mark.asyncio
+async def test_transcript_client_cache_is_keyed_by_selection_policy(tmp_path):
+    """Test that a transcript chosen by the default fallback is not served to a client with a stricter policy."""
+
+    cache = SQLiteTranscriptCache(tmp_path / "cache.db")
+    requests = []
+    tracks = [caption_track("en")]
+
+    async with httpx.AsyncClient(transport=youtube_transport(tracks, requests)) as http_client:
+        fallback = TranscriptClient(http_client=http_client, transcript_cache=cache)
+        transcript = await fallback.get_transcript_from_video_id("dQw4w9WgXcQ", "fr", output="compact")
+
+        strict = TranscriptClient(http_client=http_client, transcript_cache=cache, selection_policy=("manual",))
+        with pytest.raises(CaptionsNotFoundError):
+            await strict.get_transcript_from_video_id("dQw4w9WgXcQ", "fr")
+
+    assert transcript == [CompactSnippet("en", 0.0, 1.0)]
+    assert cache.get("dQw4w9WgXcQ", ("fr",)) == transcript
+    assert cache.get("dQw4w9WgXcQ", ("fr",), selection_policy=("manual",)) is None
@@ -0,0 +1,74 @@
+from array import array
+
+import pytest
+
+from aioytt.snippet import CompactSnippet
+from aioytt.snippet import TranscriptSnippet
+from aioytt.table import TranscriptTable
+from aioytt.transcript import parse_transcript
+
+XML = """
+<transcript>
+    <text start="0.0" dur="1.0">Hello</text>
+    <text start="1.0" dur="2.0">World</text>
+    <text start="3.0"></text>
+    <text start="3.5">No &amp; duration</text>
+</transcript>
+"""
+
+
+def test_parse_transcript_table_output():
+    """Test parse_transcript builds a columnar table with the same content as the snippet list."""
+
+    table = parse_transcript(XML, output="table")
+
+    assert isinstance(table, TranscriptTable)
+    assert table.texts == ["Hello", "World", "No & duration"]
+    assert table.starts == array("d", [0.0, 1.0, 3.5])
+    assert table.durations == array("d", [1.0, 2.0, 0.0])
+    assert table.to_snippets() == parse_transcript(XML)
+
+
+def test_transcript_table_indexing_and_iteration():
+    """Test that indexing returns snippets, slicing returns tables and iteration yields snippets."""
+
+    table = TranscriptTable.from_rows([("a", 0.0, 1.0), ("b", 1.0, 1.0), ("c", 2.0, 0.5)])
+
+    assert len(table) == 3
+    assert table[1] == CompactSnippet("b", 1.0, 1.0)
+    assert table[-1] == CompactSnippet("c", 2.0, 0.5)
+    assert table[1:] == TranscriptTable(["b", "c"], [1.0, 2.0], [1.0, 0.5])
+    assert list(table) == [CompactSnippet("a", 0.0, 1.0), CompactSnippet("b", 1.0, 1.0), CompactSnippet("c", 2.0, 0.5)]
+    assert table.to_snippets()[0] == TranscriptSnippet(text="a", start=0.0, duration=1.0)
+
+
+def test_transcript_table_exports_buffers_without_copy():
+    """Test that the timing columns can be exported through the buffer protocol."""
+
+    table = TranscriptTable.from_rows([("a", 0.0, 1.0), ("b", 1.5, 2.0)])
+
+    starts = memoryview(table.starts)
+    table.starts[1] = 2.5
+
+    assert starts.format == "d"
+    assert starts[1] == 2.5
+
+
+def test_transcript_table_to_numpy_shares_memory():
+    """Test that to_numpy returns arrays backed by the table's buffers."""
+
+    numpy = pytest.importorskip("numpy")
+    table = TranscriptTable.from_rows([("a", 0.0, 1.0), ("b", 1.5, 2.0)])
+
+    starts, durations = table.to_numpy()
+
+    assert starts.dtype == numpy.float64
+    assert list(durations) == [1.0, 2.0]
+    assert numpy.shares_memory(starts, numpy.frombuffer(table.starts, dtype=numpy.float64))
+
+
+def test_transcript_table_rejects_mismatched_columns():
+    """Test that columns of different lengths are rejected."""
+
+    with pytest.raises(ValueError):
+        TranscriptTable(["a"], [0.0, 1.0], [1.0])
@@ -1,17 +1,40 @@
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
 from typing import Final
 from unittest.mock import AsyncMock
 from unittest.mock import Mock
 from unittest.mock import patch
 
+import httpx
 import pytest
 
+from aioytt.cache import TTLCache
+from aioytt.caption import Captions
+from aioytt.caption import CaptionsData
 from aioytt.caption import CaptionTrack
+from aioytt.errors import AioyttError
 from aioytt.errors import CaptionsNotFoundError
+from aioytt.errors import InitialPlayerResponseNotFoundError
+from aioytt.errors import TranslationNotAvailableError
+from aioytt.errors import VideoUnplayableError
+from aioytt.transcript import CompactSnippet
+from aioytt.transcript import TranscriptClient
 from aioytt.transcript import TranscriptSnippet
 from aioytt.transcript import get_caption_track
 from aioytt.transcript import get_transcript_from_url
 from aioytt.transcript import get_transcript_from_video_id
+from aioytt.transcript import iter_parse_transcript
+from aioytt.transcript import parse_player_response_captions
 from aioytt.transcript import parse_transcript
+from aioytt.transcript import parse_transcript_json3
+from aioytt.transcript import parse_transcript_srv3
+
+from .fake_youtube import caption_track
+from .fake_youtube import youtube_transport
 
 VIDEO_ID: Final[str] = "dQw4w9WgXcQ"
 YOUTUBE_URL: Final[str] = f"https://www.youtube.com/watch?v={VIDEO_ID}"
@@ -51,7 +74,9 @@ async def test_get_transcript_from_url_calls_get_transcript_from_video_id():
 
         result = await get_transcript_from_url(YOUTUBE_URL, language_codes)
 
-        mock_get_transcript.assert_called_once_with(VIDEO_ID, language_codes)
+        mock_get_transcript.assert_called_once_with(
+            VIDEO_ID, language_codes, output="model", caption_format="srv1", translate_to=None, words=False
+        )
         assert result == expected_result
 
 
@@ -68,7 +93,9 @@ async def test_get_transcript_from_url_with_default_language():
 
         await get_transcript_from_url(YOUTUBE_URL)
 
-        mock_get_transcript.assert_called_once_with(VIDEO_ID, ("en",))
+        mock_get_transcript.assert_called_once_with(
+            VIDEO_ID, ("en",), output="model", caption_format="srv1", translate_to=None, words=False
+        )
 
 
 @pytest.mark.asyncio
@@ -76,10 +103,10 @@ async def test_get_transcript_from_video_id():
     """Test that get_transcript_from_video_id calls all required functions and returns parsed transcript."""
 
     with (
-        patch("aioytt.transcript.fetch_video_html", new_callable=AsyncMock) as mock_fetch_html,
-        patch("aioytt.transcript.parse_captions") as mock_parse_captions,
+        patch.object(TranscriptClient, "fetch_video_html", new_callable=AsyncMock) as mock_fetch_html,
+        patch("aioytt.transcript.parse_captions_data") as mock_parse_captions,
         patch("aioytt.transcript.get_caption_track") as mock_get_caption_track,
-        patch("aioytt.transcript.fetch_html", new_callable=AsyncMock) as mock_fetch_xml,
+        patch.object(TranscriptClient, "fetch_html", new_callable=AsyncMock) as mock_fetch_xml,
         patch("aioytt.transcript.parse_transcript") as mock_parse_transcript,
     ):
         # Setup mocks
@@ -90,8 +117,7 @@ async def test_get_transcript_from_video_id():
         mock_caption_track.base_url = "https://example.com/captions"
         mock_get_caption_track.return_value = mock_caption_track
         mock_fetch_xml.return_value = "<xml>Mock XML</xml>"
-        expected_result = [TranscriptSnippet(text="Test", start=0.0, duration=1.0)]
-        mock_parse_transcript.return_value = expected_result
+        mock_parse_transcript.return_value = [CompactSnippet("Test", 0.0, 1.0)]
 
         # Call the function
         result = await get_transcript_from_video_id(VIDEO_ID, ["en", "fr"])
@@ -99,10 +125,10 @@ async def test_get_transcript_from_video_id():
         # Verify calls
         mock_fetch_html.assert_called_once_with(VIDEO_ID)
         mock_parse_captions.assert_called_once_with(mock_fetch_html.return_value)
-        mock_get_caption_track.assert_called_once_with(mock_captions.caption_tracks, ["en", "fr"])
+        mock_get_caption_track.assert_called_once_with(mock_captions.caption_tracks, ("en", "fr"))
         mock_fetch_xml.assert_called_once_with(mock_caption_track.base_url)
-        mock_parse_transcript.assert_called_once_with(mock_fetch_xml.return_value)
-        assert result == expected_result
+        mock_parse_transcript.assert_called_once_with(mock_fetch_xml.return_value, output="compact")
+        assert result == [TranscriptSnippet(text="Test", start=0.0, duration=1.0)]
 
 
 @pytest.mark.asyncio
@@ -110,10 +136,10 @@ async def test_get_transcript_from_video_id_with_default_language():
     """Test that get_transcript_from_video_id uses default language when not specified."""
 
     with (
-        patch("aioytt.transcript.fetch_video_html", new_callable=AsyncMock) as mock_fetch_html,
-        patch("aioytt.transcript.parse_captions") as mock_parse_captions,
+        patch.object(TranscriptClient, "fetch_video_html", new_callable=AsyncMock) as mock_fetch_html,
+        patch("aioytt.transcript.parse_captions_data") as mock_parse_captions,
         patch("aioytt.transcript.get_caption_track") as mock_get_caption_track,
-        patch("aioytt.transcript.fetch_html", new_callable=AsyncMock) as mock_fetch_xml,
+        patch.object(TranscriptClient, "fetch_html", new_callable=AsyncMock) as mock_fetch_xml,
         patch("aioytt.transcript.parse_transcript") as mock_parse_transcript,
     ):
         # Setup minimal mocks
@@ -138,8 +164,8 @@ async def test_get_transcript_from_video_id_no_captions_url():
     """Test that get_transcript_from_video_id raises CaptionsNotFoundError when base_url is empty."""
 
     with (
-        patch("aioytt.transcript.fetch_video_html", new_callable=AsyncMock) as mock_fetch_html,
-        patch("aioytt.transcript.parse_captions") as mock_parse_captions,
+        patch.object(TranscriptClient, "fetch_video_html", new_callable=AsyncMock) as mock_fetch_html,
+        patch("aioytt.transcript.parse_captions_data") as mock_parse_captions,
         patch("aioytt.transcript.get_caption_track") as mock_get_caption_track,
     ):
         # Setup mocks
@@ -332,6 +358,47 @@ def test_parse_captions_success():
     assert captions.caption_tracks[0].language_code == "en"
 
 
+def test_parse_captions_ignores_trailing_script():
+    """Test parse_captions stops at the end of the player response object."""
+    html = (
+        '<script>var ytInitialPlayerResponse = {"captions": {"playerCaptionsTracklistRenderer": '
+        '{"captionTracks": [{"baseUrl": "https://example.com/{captions}", "languageCode": "en"}]}}}'
+        ';var head = document.getElementsByTagName("head")[0];</script><script>var other = {};</script>'
+    )
+
+    from aioytt.transcript import parse_captions
+
+    captions = parse_captions(html)
+    assert captions.caption_tracks[0].base_url == "https://example.com/{captions}"
+
+
+def test_parse_captions_decodes_only_captions_subtree():
+    """Test parse_captions reads the captions object without decoding the rest of the response."""
+    html = (
+        '<script>var ytInitialPlayerResponse = {"streamingData": {not valid json}, '
+        '"captions": {"playerCaptionsTracklistRenderer": {"captionTracks": [{"languageCode": "en"}]}}};</script>'
+    )
+
+    from aioytt.transcript import parse_captions
+
+    captions = parse_captions(html)
+    assert captions.caption_tracks[0].language_code == "en"
+
+
+def test_parse_captions_ignores_captions_outside_player_response():
+    """Test parse_captions falls back to a full decode when the captions key is outside the script."""
+    html = (
+        '<script>var ytInitialPlayerResponse = {"playabilityStatus": {"status": "OK"}, "videoDetails": {}};</script>'
+        '<script>var other = {"captions": {"playerCaptionsTracklistRenderer": {"captionTracks": []}}};</script>'
+    )
+
+    from aioytt.errors import CaptionsNotFoundError
+    from aioytt.transcript import parse_captions
+
+    with pytest.raises(CaptionsNotFoundError):
+        parse_captions(html)
+
+
 def test_parse_captions_no_initial_response():
     """Test parse_captions raises error when ytInitialPlayerResponse not found."""
     html = "some content without ytInitialPlayerResponse"
@@ -348,6 +415,7 @@ def test_parse_captions_no_captions():
     html = """
     some content
     var ytInitialPlayerResponse = {
+        "playabilityStatus": {"status": "OK"},
         "someOtherData": {}
     }
     </script>
@@ -383,20 +451,60 @@ def test_parse_captions_empty_caption_tracks():
 
 @pytest.mark.asyncio
 async def test_fetch_video_html():
-    """Test fetch_video_html calls fetch_html with correct parameters."""
+    """Test fetch_video_html reads the whole page with fetch_html by default."""
 
-    with patch("aioytt.transcript.fetch_html", new_callable=AsyncMock) as mock_fetch_html:
+    with patch.object(TranscriptClient, "fetch_html", new_callable=AsyncMock) as mock_fetch_html:
         mock_fetch_html.return_value = "<html>Test</html>"
 
         from aioytt.transcript import WATCH_URL
-        from aioytt.transcript import fetch_video_html
 
-        result = await fetch_video_html("test_video_id")
+        client = TranscriptClient()
+        result = await client.fetch_video_html("test_video_id")
 
         mock_fetch_html.assert_called_once_with(WATCH_URL, params={"v": "test_video_id"})
         assert result == "<html>Test</html>"
 
 
+@pytest.mark.asyncio
+async def test_fetch_video_html_stops_after_player_response():
+    """Test that the streaming watch-page fetch stops reading once the player response script ends."""
+
+    chunks = [
+        "<html><head>",
+        "<script>var ytInitialPlayer",
+        'Response = {"captions": {}};</scr',
+        "ipt>",
+        "<div>rest of the page</div>",
+        "</html>",
+    ]
+    sent = []
+
+    async def body():
+        for chunk in chunks:
+            sent.append(chunk)
+            yield chunk.encode()
+
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body()))
+    async with httpx.AsyncClient(transport=transport) as http_client:
+        client = TranscriptClient(http_client=http_client, stream_watch_page=True)
+        html = await client.fetch_video_html(VIDEO_ID)
+
+    assert html == "".join(chunks[:4])
+    assert len(sent) == 4
+
+
+@pytest.mark.asyncio
+async def test_fetch_video_html_reads_whole_page_without_player_response():
+    """Test that the streaming fetch returns the whole page when the marker is missing."""
+
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, text="<html>consent page</html>"))
+    async with httpx.AsyncClient(transport=transport) as http_client:
+        client = TranscriptClient(http_client=http_client, stream_watch_page=True)
+        html = await client.fetch_video_html(VIDEO_ID)
+
+    assert html == "<html>consent page</html>"
+
+
 @pytest.mark.asyncio
 async def test_fetch_html():
     """Test fetch_html makes correct httpx request."""
@@ -406,20 +514,69 @@ async def test_fetch_html():
     mock_response.raise_for_status = Mock()
 
     mock_client = AsyncMock()
-    mock_client.__aenter__.return_value.get.return_value = mock_response
+    mock_client.get.return_value = mock_response
 
     with patch("httpx.AsyncClient", return_value=mock_client):
         from aioytt.transcript import fetch_html
 
         result = await fetch_html("https://example.com", params={"key": "value"})
 
-        mock_client.__aenter__.return_value.get.assert_called_once_with(
-            url="https://example.com", params={"key": "value"}
-        )
+        mock_client.get.assert_called_once_with(url="https://example.com", params={"key": "value"})
         mock_response.raise_for_status.assert_called_once()
         assert result == "<html>Test response</html>"
 
 
+@pytest.mark.asyncio
+async def test_default_client_is_reused_within_event_loop():
+    """Test that module-level functions share one default client per event loop."""
+
+    from aioytt.transcript import get_default_client
+
+    assert get_default_client() is get_default_client()
+
+
+@pytest.mark.asyncio
+async def test_aclose_default_client_closes_and_replaces_client():
+    """Test that aclose_default_client closes the loop's default client and a new one is created afterwards."""
+
+    from aioytt.transcript import aclose_default_client
+    from aioytt.transcript import get_default_client
+
+    client = get_default_client()
+    await aclose_default_client()
+    await aclose_default_client()
+
+    assert client._http_client.is_closed
+    assert get_default_client() is not client
+    await aclose_default_client()
+
+
+@pytest.mark.asyncio
+async def test_transcript_client_reuses_http_client():
+    """Test that the watch page and caption requests go through the same pooled client."""
+
+    requested = []
+
+    async with httpx.AsyncClient(transport=youtube_transport([caption_track("en")], requested)) as http_client:
+        async with TranscriptClient(http_client=http_client) as client:
+            result = await client.get_transcript_from_video_id(VIDEO_ID)
+
+        assert not http_client.is_closed
+
+    assert [url.path for url in requested] == ["/watch", "/api/timedtext"]
+    assert result == [TranscriptSnippet(text="en", start=0.0, duration=1.0)]
+
+
+@pytest.mark.asyncio
+async def test_transcript_client_closes_owned_http_client():
+    """Test that aclose closes the pooled client created by the session."""
+
+    client = TranscriptClient(max_connections=4, max_keepalive_connections=2)
+    await client.aclose()
+
+    assert client._http_client.is_closed
+
+
 def test_get_caption_track_empty_language_code():
     """Test get_caption_track when empty language_codes list is provided."""
 
@@ -436,8 +593,8 @@ async def test_get_transcript_from_video_id_no_caption_tracks():
     """Test that the function raises CaptionsNotFoundError when no caption tracks are found."""
 
     with (
-        patch("aioytt.transcript.fetch_video_html", new_callable=AsyncMock) as mock_fetch_html,
-        patch("aioytt.transcript.parse_captions") as mock_parse_captions,
+        patch.object(TranscriptClient, "fetch_video_html", new_callable=AsyncMock) as mock_fetch_html,
+        patch("aioytt.transcript.parse_captions_data") as mock_parse_captions,
     ):
         mock_fetch_html.return_value = "<html>Mock HTML</html>"
 
@@ -448,3 +605,660 @@ async def test_get_transcript_from_video_id_no_caption_tracks():
 
         with pytest.raises(CaptionsNotFoundError):
             await get_transcript_from_video_id(VIDEO_ID)
+
+
+@pytest.mark.asyncio
+async def test_get_transcripts_returns_results_and_errors_in_order():
+    """Test that get_transcripts keeps input order and returns failures in place."""
+
+    async def fake_get_transcript(
+        self, video_id, language_codes, output="model", caption_format="srv1", translate_to=None, words=False
+    ):
+        if video_id == "missingvid1":
+            raise CaptionsNotFoundError()
+        return [TranscriptSnippet(text=video_id, start=0.0, duration=1.0)]
+
+    with patch.object(TranscriptClient, "get_transcript_from_video_id", fake_get_transcript):
+        client = TranscriptClient()
+        results = await client.get_transcripts(["firstvideo1", "missingvid1", YOUTUBE_URL])
+
+    assert results[0] == [TranscriptSnippet(text="firstvideo1", start=0.0, duration=1.0)]
+    assert isinstance(results[1], CaptionsNotFoundError)
+    assert results[2] == [TranscriptSnippet(text=VIDEO_ID, start=0.0, duration=1.0)]
+
+
+@pytest.mark.asyncio
+async def test_get_transcripts_bounds_concurrency():
+    """Test that get_transcripts never runs more than max_concurrency fetches at once."""
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fake_get_transcript(
+        self, video_id, language_codes, output="model", caption_format="srv1", translate_to=None, words=False
+    ):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return []
+
+    with patch.object(TranscriptClient, "get_transcript_from_video_id", fake_get_transcript):
+        client = TranscriptClient()
+        results = await client.get_transcripts([f"video{i:06d}" for i in range(10)], max_concurrency=3)
+
+    assert results == [[] for _ in range(10)]
+    assert max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_get_transcripts_rejects_invalid_concurrency():
+    """Test that get_transcripts requires a positive max_concurrency."""
+
+    with pytest.raises(ValueError):
+        await TranscriptClient().get_transcripts([VIDEO_ID], max_concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_iter_transcripts_yields_in_completion_order():
+    """Test that iter_transcripts yields results as they complete, including failures."""
+
+    delays = {"slowvideo01": 0.03, "fastvideo01": 0.0, "missingvid1": 0.01}
+
+    async def fake_get_transcript(
+        self, video_id, language_codes, output="model", caption_format="srv1", translate_to=None, words=False
+    ):
+        await asyncio.sleep(delays[video_id])
+        if video_id == "missingvid1":
+            raise CaptionsNotFoundError()
+        return [TranscriptSnippet(text=video_id, start=0.0, duration=1.0)]
+
+    with patch.object(TranscriptClient, "get_transcript_from_video_id", fake_get_transcript):
+        client = TranscriptClient()
+        results = [item async for item in client.iter_transcripts(list(delays), max_concurrency=3)]
+
+    assert [video_id for video_id, _ in results] == ["fastvideo01", "missingvid1", "slowvideo01"]
+    assert isinstance(results[1][1], CaptionsNotFoundError)
+    assert results[2][1] == [TranscriptSnippet(text="slowvideo01", start=0.0, duration=1.0)]
+
+
+@pytest.mark.asyncio
+async def test_iter_transcripts_pulls_input_lazily():
+    """Test that iter_transcripts reads no more inputs than the concurrency window allows."""
+
+    pulled = []
+
+    async def videos():
+        for i in range(100):
+            pulled.append(i)
+            yield f"video{i:06d}"
+
+    async def fake_get_transcript(
+        self, video_id, language_codes, output="model", caption_format="srv1", translate_to=None, words=False
+    ):
+        return []
+
+    with patch.object(TranscriptClient, "get_transcript_from_video_id", fake_get_transcript):
+        client = TranscriptClient()
+        iterator = client.iter_transcripts(videos(), max_concurrency=4)
+        await anext(iterator)
+        await iterator.aclose()
+
+    assert len(pulled) == 4
+
+
+@pytest.mark.asyncio
+async def test_get_transcript_from_video_id_coalesces_concurrent_calls():
+    """Test that concurrent calls for the same video and languages share one fetch."""
+
+    calls = 0
+
+    async def fake_fetch_transcript(
+        self, video_id, language_codes, caption_format="srv1", translate_to=None, words=False
+    ):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return [CompactSnippet(video_id, 0.0, 1.0)]
+
+    with patch.object(TranscriptClient, "_fetch_transcript", fake_fetch_transcript):
+        client = TranscriptClient()
+        results = await asyncio.gather(
+            client.get_transcript_from_video_id(VIDEO_ID, "en"),
+            client.get_transcript_from_video_id(VIDEO_ID, ["en"]),
+            client.get_transcript_from_video_id(VIDEO_ID, ["fr"]),
+        )
+
+    assert calls == 2
+    assert results[0] == results[1] == results[2]
+    assert results[0] is not results[1]
+
+
+@pytest.mark.asyncio
+async def test_get_captions_uses_cache():
+    """Test that cached captions are returned without downloading the watch page again."""
+
+    expire = int(time.time()) + 3600
+    captions = CaptionsData.from_json({"captionTracks": [{"baseUrl": f"https://example.com/t?expire={expire}"}]})
+    cache: TTLCache[str, CaptionsData] = TTLCache(ttl=86400)
+
+    with (
+        patch.object(TranscriptClient, "fetch_video_html", new_callable=AsyncMock) as mock_fetch_html,
+        patch("aioytt.transcript.parse_captions_data", return_value=captions),
+    ):
+        client = TranscriptClient(captions_cache=cache)
+        first = await client.get_captions(VIDEO_ID)
+        second = await client.get_captions(VIDEO_ID)
+
+    assert isinstance(first, Captions)
+    assert first == second == captions.to_model()
+    mock_fetch_html.assert_called_once_with(VIDEO_ID)
+    assert cache._entries[VIDEO_ID][0] - time.monotonic() <= 3600
+
+
+@pytest.mark.asyncio
+async def test_get_captions_does_not_cache_expired_urls():
+    """Test that captions whose signed URLs are about to expire are not cached."""
+
+    expire = int(time.time()) + 10
+    captions = CaptionsData.from_json({"captionTracks": [{"baseUrl": f"https://example.com/t?expire={expire}"}]})
+    cache: TTLCache[str, CaptionsData] = TTLCache(ttl=86400)
+
+    with (
+        patch.object(TranscriptClient, "fetch_video_html", new_callable=AsyncMock),
+        patch("aioytt.transcript.parse_captions_data", return_value=captions),
+    ):
+        client = TranscriptClient(captions_cache=cache)
+        await client.get_captions(VIDEO_ID)
+
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_get_captions_uses_negative_cache():
+    """Test that a video without captions is rejected from the negative cache without a request."""
+
+    negative_cache: TTLCache[str, type[AioyttError]] = TTLCache(ttl=600)
+    html = 'var ytInitialPlayerResponse = {"playabilityStatus": {"status": "OK"}, "someOtherData": {}}</script>'
+
+    with patch.object(TranscriptClient, "fetch_video_html", new_callable=AsyncMock) as mock_fetch_html:
+        mock_fetch_html.return_value = html
+        client = TranscriptClient(negative_cache=negative_cache)
+
+        with pytest.raises(CaptionsNotFoundError):
+            await client.get_captions(VIDEO_ID)
+        with pytest.raises(CaptionsNotFoundError):
+            await client.get_transcript_from_video_id(VIDEO_ID)
+
+    mock_fetch_html.assert_called_once_with(VIDEO_ID)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("html", "error"),
+    [
+        ("<html>Before you continue to YouTube</html>", InitialPlayerResponseNotFoundError),
+        (
+            'var ytInitialPlayerResponse = {"playabilityStatus": {"status": "LOGIN_REQUIRED", '
+            '"reason": "Sign in to confirm you\u2019re not a bot"}};</script>',
+            VideoUnplayableError,
+        ),
+    ],
+)
+async def test_get_captions_does_not_negative_cache_interstitial_pages(html, error):
+    """Test that consent pages and unplayable watch pages are fetched again instead of negative-cached."""
+
+    negative_cache: TTLCache[str, type[AioyttError]] = TTLCache(ttl=600)
+
+    with patch.object(TranscriptClient, "fetch_video_html", new_callable=AsyncMock) as mock_fetch_html:
+        mock_fetch_html.return_value = html
+        client = TranscriptClient(negative_cache=negative_cache)
+
+        for _ in range(2):
+            with pytest.raises(error):
+                await client.get_captions(VIDEO_ID)
+
+    assert mock_fetch_html.call_count == 2
+    assert len(negative_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_get_captions_does_not_negative_cache_network_errors():
+    """Test that transient network errors are not cached."""
+
+    negative_cache: TTLCache[str, type[AioyttError]] = TTLCache(ttl=600)
+
+    with patch.object(TranscriptClient, "fetch_video_html", new_callable=AsyncMock) as mock_fetch_html:
+        mock_fetch_html.side_effect = httpx.ReadError("boom")
+        client = TranscriptClient(negative_cache=negative_cache)
+
+        with pytest.raises(httpx.ReadError):
+            await client.get_captions(VIDEO_ID)
+
+    assert len(negative_cache) == 0
+
+
+def test_parse_transcript_compact_output():
+    """Test parse_transcript returns CompactSnippet tuples when requested."""
+    xml = """
+    <transcript>
+        <text start="0.0" dur="1.0">I &amp; you</text>
+        <text start="1.0"></text>
+        <text start="2.5">No duration</text>
+    </transcript>
+    """
+
+    result = parse_transcript(xml, output="compact")
+
+    assert result == [CompactSnippet("I & you", 0.0, 1.0), CompactSnippet("No duration", 2.5, 0.0)]
+    assert [snippet.to_model() for snippet in result] == parse_transcript(xml)
+
+
+@pytest.mark.asyncio
+async def test_get_transcript_from_video_id_compact_output():
+    """Test that get_transcript_from_video_id can return CompactSnippet tuples."""
+
+    async def fake_fetch_transcript(
+        self, video_id, language_codes, caption_format="srv1", translate_to=None, words=False
+    ):
+        return [CompactSnippet("Hello", 0.0, 1.0)]
+
+    with patch.object(TranscriptClient, "_fetch_transcript", fake_fetch_transcript):
+        client = TranscriptClient()
+        compact = await client.get_transcript_from_video_id(VIDEO_ID, output="compact")
+        models = await client.get_transcript_from_video_id(VIDEO_ID)
+
+    assert compact == [CompactSnippet("Hello", 0.0, 1.0)]
+    assert models == [TranscriptSnippet(text="Hello", start=0.0, duration=1.0)]
+
+
+def test_iter_parse_transcript_matches_parse_transcript():
+    """Test that incremental parsing yields the same snippets as parse_transcript."""
+    xml = """<?xml version="1.0" encoding="utf-8" ?><transcript>
+        <text start="0.0" dur="1.0">I &amp;amp; you</text>
+        <text start="1.0" dur="1.0"></text>
+        <text start="2.0">Café</text>
+    </transcript>"""
+    data = xml.encode()
+
+    result = list(iter_parse_transcript(data[i : i + 7] for i in range(0, len(data), 7)))
+
+    assert result == parse_transcript(xml, output="compact")
+
+
+def test_iter_parse_transcript_releases_read_elements():
+    """Test that elements already yielded are dropped from the tree."""
+
+    from aioytt.transcript import _TranscriptPullParser
+
+    parser = _TranscriptPullParser()
+    count = 0
+    for chunk in ["<transcript>", *(f'<text start="{i}">line {i}</text>' for i in range(100)), "</transcript>"]:
+        count += len(list(parser.feed(chunk)))
+        assert parser._root is None or len(parser._root) <= 1
+
+    assert count == 100
+
+
+@pytest.mark.asyncio
+async def test_stream_transcript_yields_before_download_finishes():
+    """Test that stream_transcript yields snippets while the caption body is still streaming."""
+
+    sent = []
+
+    async def caption_body():
+        for chunk in ["<transcript>", '<text start="0.0" dur="1.0">Hello</text>', '<text start="1.0">World</text>']:
+            sent.append(chunk)
+            yield chunk.encode()
+        sent.append("</transcript>")
+        yield b"</transcript>"
+
+    transport = youtube_transport(
+        [caption_track("en")], caption_response=lambda request: httpx.Response(200, content=caption_body())
+    )
+    async with httpx.AsyncClient(transport=transport) as http_client:
+        client = TranscriptClient(http_client=http_client)
+        snippets = []
+        async for snippet in client.stream_transcript(VIDEO_ID):
+            snippets.append((snippet, len(sent)))
+
+    assert snippets[0] == (CompactSnippet("Hello", 0.0, 1.0), 2)
+    assert [snippet for snippet, _ in snippets] == [
+        CompactSnippet("Hello", 0.0, 1.0),
+        CompactSnippet("World", 1.0, 0.0),
+    ]
+
+
+def test_parse_transcript_json3():
+    """Test that json3 events are joined into snippets and empty events are skipped."""
+    data = """{"wireMagic": "pb3", "events": [
+        {"tStartMs": 0, "dDurationMs": 5000, "id": 1, "wpWinPosId": 1},
+        {"tStartMs": 120, "dDurationMs": 2880, "segs": [{"utf8": "Hello"}, {"utf8": " world", "tOffsetMs": 400}]},
+        {"tStartMs": 3000, "aAppend": 1, "segs": [{"utf8": "\\n"}]},
+        {"tStartMs": 3000, "dDurationMs": 1500, "segs": [{"utf8": "I & you"}]}
+    ]}"""
+
+    assert parse_transcript_json3(data, output="compact") == [
+        CompactSnippet("Hello world", 0.12, 2.88),
+        CompactSnippet("I & you", 3.0, 1.5),
+    ]
+
+
+SRV3_XML: Final[str] = """<?xml version="1.0" encoding="utf-8" ?><timedtext format="3">
+<head><wp id="0" ap="7" ah="0" av="0"/></head>
+<body>
+<p t="120" d="2880" w="1"><s ac="0">Hello</s><s t="400" ac="0"> world</s></p>
+<p t="3000" d="10" w="1" a="1">
+</p>
+<p t="3000" d="1500">I &amp;amp; you</p>
+</body></timedtext>"""
+
+
+def test_parse_transcript_srv3_lines():
+    """Test that each srv3 line becomes one snippet with times converted to seconds."""
+
+    assert parse_transcript_srv3(SRV3_XML, output="compact") == [
+        CompactSnippet("Hello world", 0.12, 2.88),
+        CompactSnippet("I & you", 3.0, 1.5),
+    ]
+
+
+def test_parse_transcript_srv3_words():
+    """Test that words=True yields word segments lasting until the next word or the line end."""
+
+    assert parse_transcript_srv3(SRV3_XML, output="compact", words=True) == [
+        CompactSnippet("Hello", 0.12, 0.4),
+        CompactSnippet("world", 0.52, 2.48),
+        CompactSnippet("I & you", 3.0, 1.5),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_transcript_from_video_id_with_caption_format():
+    """Test that caption_format requests the format from the caption URL and parses it accordingly."""
+
+    requested = []
+    track = caption_track("en")
+    track["baseUrl"] += "&fmt=srv1"
+
+    def json3_response(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"events": [{"tStartMs": 0, "dDurationMs": 1000, "segs": [{"utf8": "Hi"}]}]})
+
+    async with httpx.AsyncClient(
+        transport=youtube_transport([track], requested, caption_response=json3_response)
+    ) as http_client:
+        client = TranscriptClient(http_client=http_client)
+        transcript = await client.get_transcript_from_video_id(VIDEO_ID, output="compact", caption_format="json3")
+
+    assert transcript == [CompactSnippet("Hi", 0.0, 1.0)]
+    assert requested[1].params.get_list("fmt") == ["json3"]
+    assert requested[1].params["lang"] == "en"
+
+
+@pytest.mark.asyncio
+async def test_get_transcript_from_video_id_srv3_words():
+    """Test that words=True splits srv3 lines into words and is not coalesced with a per-line request."""
+
+    transport = youtube_transport(
+        [caption_track("en")], caption_response=lambda request: httpx.Response(200, text=SRV3_XML)
+    )
+    async with httpx.AsyncClient(transport=transport) as http_client:
+        client = TranscriptClient(http_client=http_client)
+        lines, words = await asyncio.gather(
+            client.get_transcript_from_video_id(VIDEO_ID, output="compact", caption_format="srv3"),
+            client.get_transcript_from_video_id(VIDEO_ID, output="compact", caption_format="srv3", words=True),
+        )
+        with pytest.raises(ValueError):
+            await client.get_transcript_from_video_id(VIDEO_ID, caption_format="json3", words=True)
+
+    assert lines == parse_transcript_srv3(SRV3_XML, output="compact")
+    assert words == parse_transcript_srv3(SRV3_XML, output="compact", words=True)
+
+
+def _lines_transport(lines: int) -> httpx.MockTransport:
+    xml = (
+        "<transcript>" + "".join(f'<text start="{i}" dur="1.0">line {i}</text>' for i in range(lines)) + "</transcript>"
+    )
+    return youtube_transport([caption_track("en")], caption_response=lambda request: httpx.Response(200, text=xml))
+
+
+@pytest.mark.asyncio
+async def test_parse_executor_offloads_large_payloads_only():
+    """Test that payloads above parse_offload_threshold are parsed in the executor and smaller ones inline."""
+
+    parse_threads = []
+
+    def recording_parse_transcript(xml, output="model"):
+        parse_threads.append(threading.get_ident())
+        return parse_transcript(xml, output=output)
+
+    with (
+        ThreadPoolExecutor(max_workers=1) as executor,
+        patch("aioytt.transcript.parse_transcript", recording_parse_transcript),
+    ):
+        async with httpx.AsyncClient(transport=_lines_transport(100)) as http_client:
+            client = TranscriptClient(http_client=http_client, parse_executor=executor, parse_offload_threshold=1000)
+            transcript = await client.get_transcript_from_video_id(VIDEO_ID, output="compact")
+
+            client = TranscriptClient(http_client=http_client, parse_executor=executor, parse_offload_threshold=10**6)
+            await client.get_transcript_from_video_id(VIDEO_ID, output="compact")
+
+    assert len(transcript) == 100
+    assert parse_threads[0] != threading.get_ident()
+    assert parse_threads[1] == threading.get_ident()
+
+
+@pytest.mark.asyncio
+async def test_parse_executor_with_process_pool():
+    """Test that parsing results survive the round trip through a process pool."""
+
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        async with httpx.AsyncClient(transport=_lines_transport(3)) as http_client:
+            client = TranscriptClient(http_client=http_client, parse_executor=executor, parse_offload_threshold=0)
+            transcript = await client.get_transcript_from_video_id(VIDEO_ID, output="compact")
+
+    assert transcript == [CompactSnippet(f"line {i}", float(i), 1.0) for i in range(3)]
+
+
+@pytest.mark.asyncio
+async def test_get_transcripts_by_language_fetches_watch_page_once():
+    """Test that several tracks are fetched from one watch page and keyed by language or vss_id."""
+
+    tracks = [
+        caption_track("ja", vss_id=".ja"),
+        caption_track("en", vss_id=".en"),
+        caption_track("en", kind="asr", vss_id="a.en"),
+    ]
+    requested = []
+
+    async with httpx.AsyncClient(transport=youtube_transport(tracks, requested)) as http_client:
+        client = TranscriptClient(http_client=http_client)
+        by_language = await client.get_transcripts_by_language(VIDEO_ID, ["ja", "en", "fr"], output="compact")
+        assert [url.path for url in requested].count("/watch") == 1
+
+        by_vss_id = await client.get_transcripts_by_language(VIDEO_ID, output="compact")
+
+    assert by_language == {"ja": [CompactSnippet("ja", 0.0, 1.0)], "en": [CompactSnippet("en", 0.0, 1.0)]}
+    assert {key: transcript[0].text for key, transcript in by_vss_id.items()} == {
+        ".ja": "ja",
+        ".en": "en",
+        "a.en": "enasr",
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_transcripts_by_language_honours_selection_policy():
+    """Test that a selection policy picks manual tracks over earlier ASR ones and translates missing languages."""
+
+    tracks = [
+        caption_track("en", kind="asr", vss_id="a.en"),
+        caption_track("en", vss_id=".en", is_translatable=True),
+    ]
+
+    async with httpx.AsyncClient(transport=youtube_transport(tracks, translation_languages=["fr"])) as http_client:
+        client = TranscriptClient(http_client=http_client, selection_policy=("manual", "asr", "translated"))
+        transcripts = await client.get_transcripts_by_language(VIDEO_ID, ["en", "fr", "de"], output="compact")
+
+    assert {key: transcript[0].text for key, transcript in transcripts.items()} == {"en": "en", "fr": "fr"}
+
+
+def _translation_transport(requested: list[httpx.URL]) -> httpx.MockTransport:
+    tracks = [caption_track("ja", is_translatable=True), caption_track("ko", is_translatable=False)]
+    return youtube_transport(tracks, requested, translation_languages=["en", "fr"])
+
+
+@pytest.mark.asyncio
+async def test_get_transcript_from_video_id_translate_to():
+    """Test that translate_to appends tlang to the selected track's URL, unless it is already in that language."""
+
+    requested = []
+    async with httpx.AsyncClient(transport=_translation_transport(requested)) as http_client:
+        client = TranscriptClient(http_client=http_client)
+        translated = await client.get_transcript_from_video_id(VIDEO_ID, "ja", output="compact", translate_to="en")
+        original = await client.get_transcript_from_video_id(VIDEO_ID, "ja", output="compact", translate_to="ja")
+
+    assert translated == [CompactSnippet("en", 0.0, 1.0)]
+    assert original == [CompactSnippet("ja", 0.0, 1.0)]
+    caption_urls = [url for url in requested if url.path != "/watch"]
+    assert caption_urls[0].params["lang"] == "ja"
+    assert caption_urls[0].params["tlang"] == "en"
+    assert "tlang" not in caption_urls[1].params
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("language_code", "translate_to"), [("ko", "en"), ("ja", "de")])
+async def test_get_transcript_from_video_id_translation_not_available(language_code, translate_to):
+    """Test that untranslatable tracks and unlisted target languages raise TranslationNotAvailableError."""
+
+    requested = []
+    async with httpx.AsyncClient(transport=_translation_transport(requested)) as http_client:
+        client = TranscriptClient(http_client=http_client)
+        with pytest.raises(TranslationNotAvailableError):
+            await client.get_transcript_from_video_id(VIDEO_ID, language_code, translate_to=translate_to)
+
+    assert [url.path for url in requested] == ["/watch"]
+
+
+@pytest.mark.asyncio
+async def test_list_caption_tracks_reads_only_the_watch_page():
+    """Test that list_caption_tracks returns tracks and translation languages from the watch page alone."""
+
+    requested = []
+
+    async with httpx.AsyncClient(transport=_translation_transport(requested)) as http_client:
+        client = TranscriptClient(http_client=http_client)
+        captions = await client.list_caption_tracks(f"https://youtu.be/{VIDEO_ID}")
+
+    assert [track.language_code for track in captions.caption_tracks] == ["ja", "ko"]
+    assert [language.language_code for language in captions.translation_languages] == ["en", "fr"]
+    assert [url.path for url in requested] == ["/watch"]
+    assert requested[0].params["v"] == VIDEO_ID
+
+
+@pytest.mark.asyncio
+async def test_iter_caption_tracks_bounds_concurrency_and_yields_errors():
+    """Test that iter_caption_tracks limits concurrent lookups and yields failures in place of captions."""
+
+    active = 0
+    max_active = 0
+
+    async def fake_get_captions(self, video_id):
+        nonlocal active, max_active
+        active += 1
+        max_active = max(max_active, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        if video_id == "missingvid1":
+            raise CaptionsNotFoundError()
+        return Captions()
+
+    videos = ["missingvid1", *(f"video{i:06d}" for i in range(9))]
+    with patch.object(TranscriptClient, "get_captions", fake_get_captions):
+        client = TranscriptClient()
+        results = dict([item async for item in client.iter_caption_tracks(videos, max_concurrency=3)])
+
+    assert max_active == 3
+    assert results.keys() == set(videos)
+    assert isinstance(results["missingvid1"], CaptionsNotFoundError)
+    assert results["video000000"] == Captions()
+
+
+@pytest.mark.asyncio
+async def test_innertube_caption_source_posts_to_player_endpoint():
+    """Test that the innertube source discovers tracks from the player endpoint without loading the watch page."""
+
+    player_url = "http://127.0.0.1:8080/youtubei/v1/player"
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path == "/youtubei/v1/player":
+            return httpx.Response(
+                200,
+                json={
+                    "playabilityStatus": {"status": "OK"},
+                    "captions": {
+                        "playerCaptionsTracklistRenderer": {
+                            "captionTracks": [
+                                {"baseUrl": "http://127.0.0.1:8080/api/timedtext?lang=en", "languageCode": "en"}
+                            ]
+                        }
+                    },
+                },
+            )
+        return httpx.Response(200, text='<transcript><text start="0" dur="1">Hello</text></transcript>')
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+        client = TranscriptClient(
+            http_client=http_client,
+            caption_source="innertube",
+            innertube_url=player_url,
+            innertube_context={"client": {"clientName": "WEB", "clientVersion": "2.0"}},
+        )
+        transcript = await client.get_transcript_from_video_id(VIDEO_ID, output="compact")
+
+    assert transcript == [CompactSnippet("Hello", 0.0, 1.0)]
+    assert [(request.method, request.url.path) for request in requests] == [
+        ("POST", "/youtubei/v1/player"),
+        ("GET", "/api/timedtext"),
+    ]
+    body = json.loads(requests[0].content)
+    assert body["videoId"] == VIDEO_ID
+    assert body["context"] == {"client": {"clientName": "WEB", "clientVersion": "2.0"}}
+
+
+@pytest.mark.asyncio
+async def test_innertube_unplayable_video_is_not_negative_cached():
+    """Test that a LOGIN_REQUIRED player response is retried on the next call instead of negative-cached."""
+
+    negative_cache: TTLCache[str, type[AioyttError]] = TTLCache(ttl=600)
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"playabilityStatus": {"status": "LOGIN_REQUIRED"}})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+        client = TranscriptClient(http_client=http_client, caption_source="innertube", negative_cache=negative_cache)
+        for _ in range(2):
+            with pytest.raises(VideoUnplayableError):
+                await client.get_captions(VIDEO_ID)
+
+    assert len(requests) == 2
+    assert len(negative_cache) == 0
+
+
+def test_parse_player_response_captions_errors():
+    """Test that player responses without captions or without a JSON object raise the matching errors."""
+
+    with pytest.raises(CaptionsNotFoundError):
+        parse_player_response_captions(b'{"playabilityStatus": {"status": "OK"}}')
+    with pytest.raises(VideoUnplayableError, match="LOGIN_REQUIRED"):
+        parse_player_response_captions(
+            b'{"playabilityStatus": {"status": "LOGIN_REQUIRED", "reason": "Sign in to confirm your age"}}'
+        )
+    with pytest.raises(InitialPlayerResponseNotFoundError):
+        parse_player_response_captions(b"<html>")
+    with pytest.raises(ValueError):
+        TranscriptClient(caption_source="embed")
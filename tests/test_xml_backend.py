@@ -0,0 +1,80 @@
+import importlib.util
+
+import pytest
+
+from aioytt.transcript import CompactSnippet
+from aioytt.transcript import parse_transcript
+from aioytt.transcript import parse_transcript_srv3
+from aioytt.xml_backend import XML_BACKENDS
+from aioytt.xml_backend import fromstring
+from aioytt.xml_backend import get_xml_backend
+from aioytt.xml_backend import set_xml_backend
+
+AVAILABLE_BACKENDS = [
+    backend for backend in XML_BACKENDS if backend == "etree" or importlib.util.find_spec(backend) is not None
+]
+
+XML = """<?xml version="1.0" encoding="utf-8" ?><transcript>
+    <!-- comment -->
+    <text start="0.0" dur="1.5">I &amp;amp; you &amp;#39;re</text>
+    <text start="1.5" dur="1.0"></text>
+    <?processing instruction?>
+    <text start="2.5">Café</text>
+</transcript>"""
+
+
+@pytest.fixture(autouse=True)
+def restore_backend():
+    backend = get_xml_backend()
+    yield
+    set_xml_backend(backend)
+
+
+def test_set_xml_backend_auto_detects_installed_backend():
+    """Test that automatic selection picks lxml when it is installed."""
+
+    assert set_xml_backend() == AVAILABLE_BACKENDS[0]
+    assert get_xml_backend() == AVAILABLE_BACKENDS[0]
+
+
+def test_set_xml_backend_rejects_unknown_backend():
+    """Test that an unknown backend name raises ValueError."""
+
+    with pytest.raises(ValueError):
+        set_xml_backend("minidom")
+
+
+@pytest.mark.parametrize("backend", AVAILABLE_BACKENDS)
+def test_fromstring_raises_syntax_error(backend):
+    """Test that every backend reports malformed XML as a SyntaxError."""
+
+    set_xml_backend(backend)
+
+    with pytest.raises(SyntaxError):
+        fromstring("<transcript><text>")
+
+
+@pytest.mark.parametrize("backend", AVAILABLE_BACKENDS)
+@pytest.mark.parametrize("data", [XML, XML.encode()])
+def test_parse_transcript_with_backend(backend, data):
+    """Test that every backend decodes entities and skips empty elements, comments and PIs the same way."""
+
+    set_xml_backend(backend)
+
+    assert parse_transcript(data, output="compact") == [
+        CompactSnippet("I & you 're", 0.0, 1.5),
+        CompactSnippet("Café", 2.5, 0.0),
+    ]
+
+
+@pytest.mark.parametrize("backend", AVAILABLE_BACKENDS)
+def test_parse_transcript_srv3_with_backend(backend):
+    """Test that srv3 parsing gives the same result with every backend."""
+
+    set_xml_backend(backend)
+
+    xml = '<timedtext format="3"><body><p t="0" d="900"><s>Hi</s><s t="300"> there</s></p></body></timedtext>'
+    assert parse_transcript_srv3(xml, output="compact", words=True) == [
+        CompactSnippet("Hi", 0.0, 0.3),
+        CompactSnippet("there", 0.3, 0.6),
+    ]